@@ -0,0 +1,53 @@
+"""Benchmark `GroupedData` against the number of groups.
+
+Run with `python benchmarks/grouped_data.py`.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import polars as pl
+
+from plotaris.core.data import GroupedData
+
+N_ROWS = 1_000_000
+N_GROUPS = [10, 100, 1_000, 10_000, 50_000, 100_000]
+
+
+def generate(n_rows: int, n_groups: int, seed: int = 0) -> pl.DataFrame:
+    """Generate a frame whose (a, b, c) keys form about `n_groups` groups."""
+    rng = np.random.default_rng(seed)
+    key = rng.integers(0, n_groups, n_rows)
+    m = max(round(n_groups ** (1 / 3)), 1)
+    return pl.DataFrame(
+        {
+            "a": key % m,
+            "b": (key // m) % m,
+            "c": key // (m * m),
+            "x": rng.random(n_rows),
+        },
+    )
+
+
+def measure(data: pl.DataFrame, repeat: int = 3) -> float:
+    mapping = {"color": "a", "size": "b", "shape": "c", "row": ["a", "b"]}
+    times: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        GroupedData(data, mapping)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    print(f"{'groups':>8} {'seconds':>10}")
+    for n_groups in N_GROUPS:
+        data = generate(N_ROWS, n_groups)
+        n = data.select("a", "b", "c").n_unique()
+        print(f"{n:>8} {measure(data):>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
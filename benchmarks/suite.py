@@ -0,0 +1,256 @@
+"""Benchmark the hot paths of plotaris against the number of rows and groups.
+
+Run with `python benchmarks/suite.py -o results.json`, and compare two runs,
+e.g. of two commits, with `python benchmarks/suite.py --compare a.json b.json`.
+
+Each case generates a frame with `rows` rows whose key column `g` takes
+`groups` values, also split into the columns `a`, `b` and `c`. Every
+benchmark is repeated up to `--repeat` times, or until it has run for
+`--budget` seconds, and the minimum time of each stage is recorded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import subprocess
+import time
+from datetime import UTC, datetime
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import matplotlib as mpl
+
+mpl.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+
+import plotaris
+from plotaris import Chart
+from plotaris.core.data import GroupedData
+from plotaris.core.encoding import Encoding
+from plotaris.core.grid import FacetGrid
+from plotaris.marks.line import LineMark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from matplotlib.figure import Figure
+
+ROWS = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+GROUPS = [1, 10, 100, 1_000, 10_000, 100_000]
+MARKS = ["point", "line", "bar", "density"]
+
+MAX_BARS = 10_000
+"""Bar cases with more groups are skipped, since each bar is an artist."""
+MAX_PANELS = 100
+"""Facet cases with more groups are skipped, since each panel is an axes."""
+
+
+def generate(n_rows: int, n_groups: int, seed: int = 0) -> pl.DataFrame:
+    """Generate a frame whose key `g`, and `(a, b, c)`, form `n_groups` groups."""
+    rng = np.random.default_rng(seed)
+    key = np.arange(n_rows) % n_groups
+    m = max(math.ceil(n_groups ** (1 / 3)), 1)
+    return pl.DataFrame(
+        {
+            "g": key,
+            "a": key % m,
+            "b": (key // m) % m,
+            "c": key // (m * m),
+            "x": np.arange(n_rows, dtype=np.float64),
+            "y": rng.standard_normal(n_rows).cumsum(),
+        },
+    )
+
+
+def grouped_data(data: pl.DataFrame) -> dict[str, float]:
+    mapping = {"color": "a", "size": "b", "shape": "c"}
+    return timed(lambda: GroupedData(data, mapping))
+
+
+def create_scales(data: pl.DataFrame) -> dict[str, float]:
+    encoding = Encoding(color=["a"], size=["b"], shape=["c"])
+    return timed(lambda: encoding.create_scales(data))
+
+
+def display(mark: str) -> Callable[[pl.DataFrame], dict[str, float]]:
+    def run(data: pl.DataFrame) -> dict[str, float]:
+        if mark == "bar":
+            data = data.group_by("g").agg(pl.col("y").sum()).sort("g")
+            data = data.with_columns(x="g")
+
+        chart = Chart(data).encode(x="x", y="y", color="g")
+        chart = getattr(chart, f"mark_{mark}")()
+        ax = plt.figure().add_subplot()
+
+        def plot() -> Figure:
+            chart.display(ax)
+            return ax.figure  # pyright: ignore[reportReturnType]
+
+        try:
+            return timed(plot, draw=True)
+        finally:
+            plt.close("all")
+
+    return run
+
+
+def facet(data: pl.DataFrame) -> dict[str, float]:
+    wrap = math.ceil(math.sqrt(data["g"].n_unique()))
+    mark = LineMark()
+    chart = Chart(data, mark=mark).encode(x="x", y="y").facet(col="g", wrap=wrap)
+    collected = chart.collect()
+
+    def plot() -> Figure:
+        grid = FacetGrid(collected, chart.encoding, chart.facet_spec)  # pyright: ignore[reportArgumentType]
+        grid.plot(mark)
+        return grid.fig
+
+    try:
+        return timed(plot, draw=True)
+    finally:
+        plt.close("all")
+
+
+def timed(func: Callable[[], Any], *, draw: bool = False) -> dict[str, float]:
+    """Time `func`, and then drawing the figure it returns on the Agg canvas."""
+    start = time.perf_counter()
+    fig = func()
+    times = {"run": time.perf_counter() - start}
+
+    if draw:
+        start = time.perf_counter()
+        fig.canvas.draw()
+        times["draw"] = time.perf_counter() - start
+
+    return times
+
+
+BENCHMARKS: dict[str, Callable[[pl.DataFrame], dict[str, float]]] = {
+    "grouped_data": grouped_data,
+    "create_scales": create_scales,
+    **{f"display_{mark}": display(mark) for mark in MARKS},
+    "facet": facet,
+}
+
+
+def skip(name: str, n_groups: int) -> str | None:
+    """Return why a case is skipped, or None if it runs."""
+    if name == "display_bar" and n_groups > MAX_BARS:
+        return f"more than {MAX_BARS} bars"
+    if name == "facet" and n_groups > MAX_PANELS:
+        return f"more than {MAX_PANELS} panels"
+    return None
+
+
+def measure(
+    bench: Callable[[pl.DataFrame], dict[str, float]],
+    data: pl.DataFrame,
+    repeat: int,
+    budget: float,
+) -> dict[str, float]:
+    """Return the minimum time of each stage over the repeats."""
+    best: dict[str, float] = {}
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        for stage, seconds in bench(data).items():
+            best[stage] = min(best.get(stage, math.inf), seconds)
+        if time.perf_counter() - start > budget:
+            break
+
+    return best
+
+
+def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    names = args.bench or list(BENCHMARKS)
+    results: list[dict[str, Any]] = []
+
+    for n_rows in args.rows:
+        for n_groups in args.groups:
+            if n_groups > n_rows:
+                continue
+
+            data = generate(n_rows, n_groups)
+            for name in names:
+                case = {"benchmark": name, "rows": n_rows, "groups": n_groups}
+                if reason := skip(name, n_groups):
+                    results.append({**case, "skipped": reason})
+                    continue
+
+                times = measure(BENCHMARKS[name], data, args.repeat, args.budget)
+                results.append({**case, "seconds": times})
+                stages = " ".join(f"{k}={v:.4f}" for k, v in times.items())
+                print(f"{name:>16} {n_rows:>9} {n_groups:>7} {stages}", flush=True)
+
+    return results
+
+
+def metadata() -> dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "versions": {p: version(p) for p in ["polars", "matplotlib", "numpy"]},
+    }
+
+
+def compare(base: Path, head: Path) -> None:
+    """Print the ratio of the times of `head` to those of `base`."""
+
+    def load(path: Path) -> dict[tuple[str, int, int, str], float]:
+        results = json.loads(path.read_text())["results"]
+        return {
+            (r["benchmark"], r["rows"], r["groups"], stage): seconds
+            for r in results
+            for stage, seconds in r.get("seconds", {}).items()
+        }
+
+    a, b = load(base), load(head)
+    print(f"{'benchmark':>16} {'rows':>9} {'groups':>7} {'stage':>5} {'ratio':>7}")
+    for key in sorted(a.keys() & b.keys()):
+        name, n_rows, n_groups, stage = key
+        ratio = b[key] / a[key] if a[key] else math.inf
+        print(f"{name:>16} {n_rows:>9} {n_groups:>7} {stage:>5} {ratio:>7.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths of plotaris.")
+    parser.add_argument("-o", "--output", type=Path, help="write results as JSON")
+    parser.add_argument("--rows", type=int, nargs="+", default=ROWS)
+    parser.add_argument("--groups", type=int, nargs="+", default=GROUPS)
+    parser.add_argument("--bench", nargs="+", choices=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=5.0)
+    parser.add_argument("--compare", type=Path, nargs=2, metavar=("BASE", "HEAD"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    plotaris.init()
+    report = {"metadata": metadata(), "results": run(args)}
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,37 @@
 from __future__ import annotations
 
-from .config import init
-from .core.chart import Chart
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Chart", "init"]
+if TYPE_CHECKING:
+    from .batch import render_many
+    from .cache import RenderCache
+    from .config import init
+    from .core.chart import Chart
+    from .core.profile import Profile
+
+__all__ = ["Chart", "Profile", "RenderCache", "init", "render_many"]
+
+# Public names and their modules, imported on first access so that
+# `import plotaris` does not load Polars or matplotlib.
+_modules = {
+    "Chart": ".core.chart",
+    "Profile": ".core.profile",
+    "RenderCache": ".cache",
+    "init": ".config",
+    "render_many": ".batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if (module := _modules.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import io
+import multiprocessing
+import os
+import time
+import traceback
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import polars as pl
+from matplotlib import rcParams
+
+from .core.chart import Chart
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
+
+    from .core.encoding import Encoding
+    from .core.grid import FacetSpec
+    from .marks.base import Mark
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    """The outcome of rendering one chart with `render_many`."""
+
+    name: str
+    """The name of the chart, which is also the stem of its file."""
+    path: Path
+    """The file the chart is written to."""
+    seconds: float
+    """The wall time spent in the worker, including deserialization."""
+    error: str | None = None
+    """The formatted traceback if rendering failed."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class Task:
+    """A chart spec with its data in a form that is cheap to send to a worker.
+
+    A `DataFrame` is sent as Arrow IPC bytes. A `LazyFrame` is sent as its
+    query plan, so the worker reads the source itself.
+    """
+
+    name: str
+    path: Path
+    encoding: Encoding
+    mark: Mark | None
+    facet_spec: FacetSpec | None
+    data: bytes | pl.LazyFrame
+    format: str
+    kwargs: dict[str, Any] = field(default_factory=dict[str, Any])
+
+    @classmethod
+    def from_chart(
+        cls,
+        name: str,
+        chart: Chart,
+        path: Path,
+        format: str,  # noqa: A002
+        kwargs: dict[str, Any],
+    ) -> Task:
+        data = chart.data
+        if isinstance(data, pl.DataFrame):
+            buffer = io.BytesIO()
+            data.write_ipc(buffer, compression="uncompressed")
+            data = buffer.getvalue()
+
+        return cls(
+            name,
+            path,
+            chart.encoding,
+            chart.mark,
+            chart.facet_spec,
+            data,
+            format,
+            kwargs,
+        )
+
+    def chart(self) -> Chart:
+        data = self.data
+        if isinstance(data, bytes):
+            data = pl.read_ipc(io.BytesIO(data))
+
+        return Chart(data, self.encoding, self.mark, self.facet_spec)
+
+
+def render_many(
+    charts: Iterable[Chart] | Mapping[str, Chart],
+    out_dir: str | Path,
+    *,
+    format: str = "png",  # noqa: A002
+    workers: int | None = None,
+    max_tasks_per_child: int | None = 100,
+    callback: Callable[[RenderResult], None] | None = None,
+    **kwargs: Any,
+) -> list[RenderResult]:
+    """Render many charts to files in parallel worker processes.
+
+    Each chart is written to `out_dir/<name>.<format>`, where the name is the
+    key of `charts` if it is a mapping, or the position of the chart
+    otherwise. The workers use the Agg backend and the `rcParams` of the
+    calling process, and are replaced after `max_tasks_per_child` charts to
+    bound their memory.
+
+    Charts are serialized as they are submitted, with at most two per worker
+    waiting at a time, so `charts` may be a lazy iterable. A failing chart
+    does not stop the others: its traceback is stored in the result.
+    `callback` is called with each result as soon as it is available.
+
+    `kwargs` are passed to `Chart.render`.
+
+    Returns:
+        The results in the order the charts finish.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    if isinstance(charts, Mapping):
+        items = cast("Mapping[str, Chart]", charts).items()
+    else:
+        items = enumerate(charts)
+    tasks = (
+        Task.from_chart(
+            str(name),
+            chart,
+            out_dir / f"{name}.{format}",
+            format,
+            kwargs,
+        )
+        for name, chart in items
+    )
+
+    rc = {k: v for k, v in rcParams.items() if k != "backend"}
+    results: list[RenderResult] = []
+
+    with ProcessPoolExecutor(
+        workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize,
+        initargs=(rc,),
+        max_tasks_per_child=max_tasks_per_child,
+    ) as executor:
+        for result in _run(executor, tasks, 2 * workers):
+            results.append(result)
+            if callback:
+                callback(result)
+
+    return results
+
+
+def _run(
+    executor: ProcessPoolExecutor,
+    tasks: Iterator[Task],
+    max_pending: int,
+) -> Iterator[RenderResult]:
+    pending: dict[Future[RenderResult], Task] = {}
+
+    while True:
+        for task in tasks:
+            pending[executor.submit(_render, task)] = task
+            if len(pending) >= max_pending:
+                break
+
+        if not pending:
+            return
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            task = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as e:  # noqa: BLE001
+                # The worker died, e.g. killed for running out of memory.
+                result = RenderResult(task.name, task.path, 0, repr(e))
+            yield result
+
+
+def _initialize(rc: dict[str, Any]) -> None:
+    import matplotlib as mpl  # noqa: PLC0415
+
+    mpl.use("Agg")
+    mpl.rcParams.update(rc)  # pyright: ignore[reportCallIssue, reportArgumentType]
+
+
+def _render(task: Task) -> RenderResult:
+    start = time.perf_counter()
+
+    try:
+        chart = task.chart()
+        task.path.write_bytes(chart.render(task.format, **task.kwargs))
+    except Exception:  # noqa: BLE001
+        error = traceback.format_exc()
+    else:
+        error = None
+
+    return RenderResult(task.name, task.path, time.perf_counter() - start, error)
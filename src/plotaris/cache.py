@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, is_dataclass
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+from matplotlib import rcParams
+
+
+@dataclass
+class CacheStats:
+    """Counters of a `RenderCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class RenderCache:
+    """A content-addressed cache of rendered charts on disk.
+
+    Each entry is one file named by the key of the chart. Reading an entry
+    refreshes its modification time, and once the total size exceeds
+    `max_bytes`, the least recently used entries are removed. Entries are
+    written atomically, so several processes may share a directory.
+    """
+
+    directory: Path
+    """The directory holding the entries."""
+    max_bytes: int
+    """The size that the entries may take in total."""
+    stats: CacheStats
+    """The hits, misses and evictions of this instance."""
+
+    def __init__(self, directory: str | Path, max_bytes: int = 256 * 2**20) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._size: int = sum(path.stat().st_size for path in self._entries())
+
+    def key(self, data: pl.DataFrame | pl.LazyFrame, *spec: Any) -> str:
+        """Return the key of the data rendered according to `spec`.
+
+        The spec is any number of objects, such as the encoding, the mark and
+        the output options, and the `rcParams` are added to it. The data is
+        hashed with Polars' row hashes, which are only stable for one Polars
+        version, so the versions are part of the key too.
+        """
+        spec = (
+            *spec,
+            {k: v for k, v in rcParams.items() if k != "backend"},
+            [version("polars"), version("matplotlib")],
+        )
+        digest = hashlib.sha256(json.dumps(normalize(spec), sort_keys=True).encode())
+        hash_data(digest, data)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Return the entry of a key, or None if there is none."""
+        path = self.directory / key
+
+        try:
+            content = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """Store an entry and evict old entries if the cache is full."""
+        with tempfile.NamedTemporaryFile(dir=self.directory, delete=False) as f:
+            f.write(content)
+        Path(f.name).replace(self.directory / key)
+
+        self._size += len(content)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits."""
+        stats = [(path, path.stat()) for path in self._entries()]
+        stats.sort(key=lambda item: item[1].st_mtime)
+        self._size = sum(stat.st_size for _, stat in stats)
+
+        for path, stat in stats:
+            if self._size <= self.max_bytes:
+                break
+
+            path.unlink(missing_ok=True)
+            self._size -= stat.st_size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+        self._size = 0
+
+    def _entries(self) -> list[Path]:
+        return [p for p in self.directory.iterdir() if len(p.name) == 64]  # noqa: PLR2004
+
+
+def normalize(obj: Any) -> Any:  # noqa: PLR0911
+    """Convert an object to a JSON-serializable form for hashing."""
+    if isinstance(obj, pl.Expr):
+        return obj.meta.serialize(format="json")
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: normalize(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, Mapping):
+        return {str(k): normalize(v) for k, v in obj.items()}  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+    if isinstance(obj, list | tuple):
+        return [normalize(v) for v in obj]  # pyright: ignore[reportUnknownVariableType]
+    if obj is None or isinstance(obj, str | int | float):
+        return obj
+    if hasattr(obj, "__dict__"):
+        name = f"{type(obj).__module__}.{type(obj).__qualname__}"
+        return {"type": name, **normalize(vars(obj))}
+    return repr(obj)
+
+
+def hash_data(digest: hashlib._Hash, data: pl.DataFrame | pl.LazyFrame) -> None:  # pyright: ignore[reportPrivateUsage]
+    """Update a digest with the schema and rows of the data.
+
+    A `LazyFrame` is hashed within its query, so only one integer per row is
+    collected. `Chart.render` passes the projection of its data onto the
+    columns it reads, so no other column is read.
+    """
+    digest.update(str(data.collect_schema()).encode())
+
+    if not data.collect_schema():
+        return
+
+    if isinstance(data, pl.DataFrame):
+        hashes = data.hash_rows(seed=0)
+    else:
+        hashes = data.select(pl.struct(pl.all()).hash(seed=0)).collect().to_series()
+
+    digest.update(hashes.to_numpy().tobytes())
@@ -2,9 +2,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-import matplotlib.pyplot as plt
-from matplotlib import rcParams
-
 
 @dataclass
 class Config:
@@ -29,6 +26,9 @@ def init(
     titlesize: float = 9.5,
     ticksize: float = 8.5,
 ) -> None:
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+    from matplotlib import rcParams  # noqa: PLC0415
+
     plt.style.use(style)
 
     rcParams["figure.dpi"] = dpi
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from .data import X, Y
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from matplotlib.axes import Axes
+
+
+def to_codes(
+    data: pl.DataFrame,
+    categories: Mapping[str, list[str]] | None = None,
+) -> tuple[pl.DataFrame, dict[str, list[str]]]:
+    """Replace categorical `X` and `Y` columns by the index of their category.
+
+    String, `Categorical` and `Enum` columns are cast to one `Enum` of
+    their values, in the order of first appearance after the known
+    `categories`, and replaced by its physical codes. Nulls stay null.
+
+    Returns:
+        The converted data, and the categories of each converted column,
+        which extend the known ones.
+    """
+    known = categories or {}
+    result: dict[str, list[str]] = {}
+    exprs: list[pl.Expr] = []
+
+    for name in (X, Y):
+        if name not in data.columns:
+            continue
+        if not isinstance(data[name].dtype, pl.String | pl.Categorical | pl.Enum):
+            continue
+
+        values = data[name].cast(pl.String).drop_nulls().unique(maintain_order=True)
+        old = known.get(name, [])
+        new = values.filter(~values.is_in(old)).to_list()
+        result[name] = cats = [*old, *new]
+
+        codes = pl.col(name).cast(pl.String).cast(pl.Enum(cats)).to_physical()
+        exprs.append(codes.cast(pl.Int64))
+
+    return (data.with_columns(exprs) if exprs else data), result
+
+
+def set_category_axes(ax: Axes, categories: Mapping[str, list[str]]) -> None:
+    """Place a labeled tick at the code of each category of converted columns."""
+    if not categories:
+        return
+
+    from matplotlib.ticker import FixedFormatter, FixedLocator  # noqa: PLC0415
+
+    for name, cats in categories.items():
+        axis = ax.xaxis if name == X else ax.yaxis
+        axis.set_major_locator(FixedLocator(range(len(cats))))
+        axis.set_major_formatter(FixedFormatter(cats))
@@ -1,37 +1,64 @@
 from __future__ import annotations
 
+import io
 from dataclasses import replace
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self
 
-import matplotlib.pyplot as plt
+import polars as pl
 
 from plotaris.marks.bar import BarMark
+from plotaris.marks.density import DensityMark
+from plotaris.marks.hist import HistMark
 from plotaris.marks.line import LineMark
 from plotaris.marks.point import PointMark
 
-from .data import GroupedData, to_list
+from .categories import set_category_axes, to_codes
+from .data import select, to_list
+from .dates import set_date_axes, to_dates
 from .encoding import Encoding
 from .grid import FacetGrid, FacetSpec
+from .profile import Profile, count_artists
+from .scale import with_codes
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
 
     import numpy as np
-    import polars as pl
     from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from polars._typing import EngineType
 
+    from plotaris.cache import RenderCache
     from plotaris.marks.base import Mark
 
+    from .encoding import Scope
+    from .grid import Scales
+    from .scale import Scale
+
+APPEND_CHUNKS = 64
+"""The number of chunks after which the rows added by `append` are
+rechunked."""
+
 
 class Chart:
-    data: pl.DataFrame
+    data: pl.DataFrame | pl.LazyFrame
     encoding: Encoding
     mark: Mark | None
     facet_spec: FacetSpec | None
+    profile: Profile | None
+    """The stages of the last `display` or `render` with profiling on."""
+    _ax: Axes | None
+    _scales: dict[str, Scale[Any]]
+    _categories: dict[str, list[str]]
+    _artists: dict[Any, Any]
+    _batches: Iterator[pl.DataFrame] | None
+    _source: pl.DataFrame | pl.LazyFrame
+    _appended: pl.DataFrame | None
 
     def __init__(
         self,
-        data: pl.DataFrame,
+        data: pl.DataFrame | pl.LazyFrame,
         encoding: Encoding | None = None,
         mark: Mark | None = None,
         facet_spec: FacetSpec | None = None,
@@ -40,6 +67,27 @@ class Chart:
         self.encoding = encoding or Encoding()
         self.mark = mark
         self.facet_spec = facet_spec
+        self.profile = None
+        self._ax = None
+        self._scales = {}
+        self._categories = {}
+        self._artists = {}
+        self._batches = None
+        self._source = data
+        self._appended = None
+
+    @classmethod
+    def from_batches(cls, batches: Iterable[pl.DataFrame]) -> Self:
+        """Create a chart that draws a stream of data batches one at a time.
+
+        `display` consumes the batches and adds each one to the drawing as
+        `append` does, so only one batch is in memory at a time besides the
+        artists. The batches are not kept, so the chart can be displayed
+        once, without facets, and rendered without a cache.
+        """
+        chart = cls(pl.DataFrame())
+        chart._batches = iter(batches)
+        return chart
 
     def encode(
         self,
@@ -48,14 +96,21 @@ class Chart:
         color: str | Iterable[str] | None = None,
         size: str | Iterable[str] | None = None,
         shape: str | Iterable[str] | None = None,
+        *,
+        scope: Scope | None = None,
     ) -> Self:
-        """Map variables to visual properties, updating existing encodings."""
+        """Map variables to visual properties, updating existing encodings.
+
+        Expressions for x and y are evaluated once on the whole data, or per
+        aesthetic and facet group with `scope="group"`.
+        """
         changes = {
             "x": x,
             "y": y,
             "color": to_list(color) or None,
             "size": to_list(size) or None,
             "shape": to_list(shape) or None,
+            "scope": scope,
         }
         changes = {k: v for k, v in changes.items() if v is not None}
         self.encoding = replace(self.encoding, **changes)
@@ -67,12 +122,21 @@ class Chart:
         row: str | Iterable[str] | None = None,
         col: str | Iterable[str] | None = None,
         wrap: int | None = None,
+        sparse: bool = False,
+        scales: Scales = "fixed",
     ) -> Self:
-        """Create a facet grid of subplots."""
+        """Create a facet grid of subplots.
+
+        With `sparse`, only the row and column combinations present in the
+        data get a subplot. `scales` frees the x or y limits, or both, to
+        vary across the grid columns or rows.
+        """
         self.facet_spec = FacetSpec(
             row=to_list(row) or None,
             col=to_list(col) or None,
             wrap=wrap,
+            sparse=sparse,
+            scales=scales,
         )
         return self
 
@@ -88,36 +152,313 @@ class Chart:
         self.mark = BarMark(**kwargs)
         return self
 
-    def display(self, ax: Axes | None = None) -> Axes | np.ndarray[Any, Any]:
+    def mark_hist(self, **kwargs: Any) -> Self:
+        self.mark = HistMark(**kwargs)
+        return self
+
+    def mark_density(self, **kwargs: Any) -> Self:
+        self.mark = DensityMark(**kwargs)
+        return self
+
+    def collect(self, *, engine: EngineType = "auto") -> pl.DataFrame:
+        """Collect only the encoded columns of the data in a single query.
+
+        The mark's `transform` is part of the query, so marks that reduce the
+        data (e.g. by binning) do so before anything is materialized.
+        Temporal x and y values become matplotlib date numbers, while
+        categorical ones are kept as they are, to be coded by `display`.
+        """
+        if self._batches is not None:
+            msg = "Charts from batches cannot be collected, since they keep no data"
+            raise ValueError(msg)
+
+        return self._query()[0].collect(engine=engine)
+
+    def _select(self) -> pl.LazyFrame:
+        """Return the projection of the data onto the columns the chart reads."""
+        by = self.facet_spec.columns() if self.facet_spec else []
+        extra = self.mark.exprs() if self.mark else {}
+        return select(self.data, self.encoding, by, extra)
+
+    def _query(self) -> tuple[pl.LazyFrame, dict[str, str | None]]:
+        """Return the query of `collect` and the time zones of its dates."""
+        by = self.facet_spec.columns() if self.facet_spec else []
+        data, zones = to_dates(self._select())
+
+        if self.mark:
+            data = self.mark.transform(data, sorted({*self.encoding.columns(), *by}))
+
+        return data, zones
+
+    def display(
+        self,
+        ax: Axes | None = None,
+        *,
+        engine: EngineType = "auto",
+        profile: bool | Callable[[Profile], None] = False,
+    ) -> Axes | np.ndarray[Any, Any]:
+        """Draw the chart on `ax`, or on a facet grid or the current axes.
+
+        With `profile`, the wall time, rows, groups and artists of each stage
+        are recorded in a `Profile`, which is stored in `self.profile` and
+        passed to `profile` if it is a callable.
+        """
+        prof = Profile() if profile else None
+        result = self._display(ax, engine, prof)
+        self._report(prof, callback=profile)
+        return result
+
+    def _display(
+        self,
+        ax: Axes | None,
+        engine: EngineType,
+        profile: Profile | None,
+        fig: Figure | None = None,
+    ) -> Axes | np.ndarray[Any, Any]:
+        """Draw the chart as `display` does.
+
+        Facet grids are created on `fig` if given, and otherwise on a new
+        pyplot figure. pyplot is only used if neither `ax` nor `fig` is given.
+        """
         if self.mark is None:
             msg = "Mark must be defined before displaying the chart"
             raise ValueError(msg)
 
+        if self._batches is not None:
+            if self.facet_spec:
+                msg = "Charts from batches cannot be faceted"
+                raise ValueError(msg)
+
+            return self._display_batches(self.mark, ax or gca(), profile)
+
+        query, zones = self._query()
+        data = query.collect(engine=engine)
+        if profile:
+            profile.lap("collect", rows=len(data))
+
         if self.facet_spec:
-            grid = FacetGrid(self.data, self.encoding, self.facet_spec)
-            grid.plot(self.mark, self.encoding)
+            grid = FacetGrid(data, self.encoding, self.facet_spec, profile, fig)
+            grid.plot(self.mark, zones)
+            self._ax = None
             return grid.axes
 
-        ax = ax or plt.gca()
+        ax = ax or gca()
+
+        scales = self.encoding.create_scales(data)
+        data, categories = to_codes(with_codes(data, scales))
+        if profile:
+            groups = sum(len(scale) for scale in scales.values())
+            profile.lap("scales", rows=len(data), groups=groups)
+
+        n = count_artists(ax) if profile else 0
+        self._artists = {}
+        self._appended = None
+        self.mark.update(ax, data, scales, self._artists)
+        set_date_axes(ax, zones)
+        set_category_axes(ax, categories)
+        self._ax, self._scales, self._categories = ax, scales, categories
+        if profile:
+            profile.lap("draw", rows=len(data), artists=count_artists(ax) - n)
+
+        return ax
+
+    def _report(
+        self,
+        profile: Profile | None,
+        *,
+        callback: bool | Callable[[Profile], None],
+    ) -> None:
+        if profile is None:
+            return
+
+        self.profile = profile
+        if callable(callback):
+            callback(profile)
+
+    def append(self, data: pl.DataFrame) -> Self:
+        """Add rows to the data and to the chart drawn by the last `display`.
+
+        Only the new rows are evaluated and drawn. Scales gain the new keys
+        without changing the values of existing ones, and marks extend the
+        artists of known groups in place. Expressions see the new rows only,
+        so those that depend on earlier rows, e.g. with `scope="group"`, are
+        not continued.
+
+        The added rows are kept in one frame next to the displayed data, so
+        `data` holds at most `APPEND_CHUNKS` more chunks, or one more concat
+        node for a `LazyFrame`, however often rows are appended. That frame
+        is rechunked when it exceeds the limit, which copies the rows added
+        so far.
+        """
+        if self.mark is None or self._ax is None:
+            msg = "Chart must be displayed without facets before appending data"
+            raise ValueError(msg)
+
+        if not self.mark.appendable():
+            msg = f"{type(self.mark).__name__} does not support appending data"
+            raise ValueError(msg)
+
+        if self.encoding.aggregates():
+            msg = "Aggregated encodings do not support appending data"
+            raise ValueError(msg)
+
+        self._add(self.mark, self._ax, data)
+
+        if self._batches is not None:
+            return self
+
+        if self._appended is None:
+            self._source, self._appended = self.data, data
+        else:
+            self._appended = self._appended.vstack(data)
+            if self._appended.n_chunks() > APPEND_CHUNKS:
+                self._appended = self._appended.rechunk()
+
+        if isinstance(self._source, pl.LazyFrame):
+            self.data = pl.concat([self._source, self._appended.lazy()])
+        else:
+            self.data = self._source.vstack(self._appended)
+
+        return self
 
-        palettes = self.encoding.create_palettes(self.data)
-        mapping = dict(self.encoding.items())
-        gd = GroupedData(self.data, mapping)
+    def _display_batches(
+        self,
+        mark: Mark,
+        ax: Axes,
+        profile: Profile | None,
+    ) -> Axes:
+        if not mark.appendable():
+            msg = f"{type(mark).__name__} does not support drawing batches"
+            raise ValueError(msg)
 
-        for df in gd.data:
-            kwargs: dict[str, Any] = {}
+        if self.encoding.aggregates():
+            msg = "Aggregated encodings do not support drawing batches"
+            raise ValueError(msg)
 
-            for name, palette in palettes.items():
-                columns = self.encoding.get(name)
-                key = df.select(columns).row(0)
-                kwargs[name] = palette[key]
+        self._ax, self._scales, self._categories, self._artists = ax, {}, {}, {}
 
-            x = df.select(self.encoding.x).to_series()
-            y = df.select(self.encoding.y).to_series()
+        empty = True
+        for batch in self._batches or ():
+            n = count_artists(ax) if profile else 0
+            self._add(mark, ax, batch)
+            empty = False
+            if profile:
+                profile.lap("batch", rows=len(batch), artists=count_artists(ax) - n)
 
-            self.mark.plot(ax=ax, x=x, y=y, **kwargs)
+        if empty:
+            msg = "No batches to display; they are consumed by the first display"
+            raise ValueError(msg)
 
         return ax
 
+    def _add(self, mark: Mark, ax: Axes, data: pl.DataFrame) -> None:
+        """Evaluate rows and draw them, creating or extending the scales.
+
+        New categories of x and y are coded after the known ones.
+        """
+        query, zones = to_dates(select(data, self.encoding, extra=mark.exprs()))
+        rows, self._categories = to_codes(query.collect(), self._categories)
+
+        if self._scales:
+            self._scales = {k: s.extend(rows) for k, s in self._scales.items()}
+        else:
+            self._scales = self.encoding.create_scales(rows)
+
+        mark.update(ax, with_codes(rows, self._scales), self._scales, self._artists)
+        set_date_axes(ax, zones)
+        set_category_axes(ax, self._categories)
+
+    def render(
+        self,
+        format: str = "png",  # noqa: A002
+        *,
+        engine: EngineType = "auto",
+        cache: RenderCache | None = None,
+        profile: bool | Callable[[Profile], None] = False,
+        **kwargs: Any,
+    ) -> bytes:
+        """Draw the chart on a new figure and return it as image bytes.
+
+        The figure is standalone, with an Agg canvas, and never registered
+        with pyplot, so charts can be rendered concurrently from several
+        threads and nothing needs to be closed. `kwargs`, e.g. `dpi`, are
+        passed to `savefig`.
+        With a `cache`, a chart rendered before is returned from it without
+        drawing anything, after hashing only the columns the chart reads.
+        `profile` is as for `display`, with the stages of the cache and
+        `savefig` added.
+        """
+        prof = Profile() if profile else None
+        content = self._render_cached(format, engine, cache, prof, kwargs)
+        self._report(prof, callback=profile)
+        return content
+
+    def _render_cached(
+        self,
+        format: str,  # noqa: A002
+        engine: EngineType,
+        cache: RenderCache | None,
+        profile: Profile | None,
+        kwargs: dict[str, Any],
+    ) -> bytes:
+        if cache is None:
+            return self._render(format, engine, profile, kwargs)
+
+        if self._batches is not None:
+            msg = "Charts from batches cannot be cached, since they keep no data"
+            raise ValueError(msg)
+
+        # Hash the projection, so that a hit reads no more than a render
+        spec = (self.encoding, self.mark, self.facet_spec, format, kwargs)
+        key = cache.key(self._select(), *spec)
+        content = cache.get(key)
+        if profile:
+            profile.lap("cache", groups=int(content is not None))
+
+        if content is None:
+            content = self._render(format, engine, profile, kwargs)
+            cache.put(key, content)
+
+        return content
+
+    def _render(
+        self,
+        format: str,  # noqa: A002
+        engine: EngineType,
+        profile: Profile | None,
+        kwargs: dict[str, Any],
+    ) -> bytes:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: PLC0415
+        from matplotlib.figure import Figure  # noqa: PLC0415
+
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = None if self.facet_spec else fig.add_subplot()
+        self._display(ax, engine, profile, fig)
+
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=format, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+        if profile:
+            profile.lap("savefig")
+
+        return buffer.getvalue()
+
+    def save(self, path: str | Path, **kwargs: Any) -> None:
+        """Render the chart to a file without pyplot, as `render` does.
+
+        The format defaults to the suffix of `path`. `kwargs` are passed to
+        `render`.
+        """
+        path = Path(path)
+        kwargs.setdefault("format", path.suffix.removeprefix(".") or "png")
+        path.write_bytes(self.render(**kwargs))
+
     def _display_(self) -> Axes | np.ndarray[Any, Any]:
         return self.display()
+
+
+def gca() -> Axes:
+    """Return the current axes of pyplot, creating them if needed."""
+    import matplotlib.pyplot as plt  # noqa: PLC0415
+
+    return plt.gca()
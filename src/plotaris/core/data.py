@@ -7,9 +7,19 @@ import polars as pl
 if TYPE_CHECKING:
     from collections.abc import Iterable, Mapping
 
+    from .encoding import Encoding
+
+X = "_x"
+"""The column name of the evaluated x encoding in a collected frame."""
+Y = "_y"
+"""The column name of the evaluated y encoding in a collected frame."""
+INDEX = "_index"
+
 
 class GroupedData:
     mapping: dict[str, list[str]]
+    keys: pl.DataFrame
+    """The values of the grouping columns, one row per group."""
     group: pl.DataFrame
     data: list[pl.DataFrame]
 
@@ -20,25 +30,24 @@ class GroupedData:
     ) -> None:
         self.mapping = {name: to_list(cs) for name, cs in mapping.items()}
 
+        by = sorted({c for cs in self.mapping.values() for c in cs})
+
         if data.is_empty():
+            self.keys = pl.DataFrame({c: [] for c in by})
             self.group = pl.DataFrame({n: [] for n in self.mapping})
             self.data = []
             return
 
-        by = sorted({c for cs in self.mapping.values() for c in cs})
-
         if not by:
+            self.keys = pl.DataFrame([{}])
             self.group = pl.DataFrame([{}])
             self.data = [data]
             return
 
-        group, self.data = group_by(data, *by)
-
-        for name, cs in self.mapping.items():
-            group = with_index(group, cs, f"_{name}_index")
+        self.keys, self.data = group_by(data, *by)
 
-        named_exprs = {name: f"_{name}_index" for name in self.mapping}
-        self.group = group.select(**named_exprs)
+        named_exprs = {name: index(cs) for name, cs in self.mapping.items()}
+        self.group = self.keys.with_row_index(INDEX).select(**named_exprs)
 
     def __len__(self) -> int:
         return len(self.group)
@@ -89,23 +98,67 @@ def to_list(columns: str | Iterable[str] | None, /) -> list[str]:
 
 
 def group_by(data: pl.DataFrame, *by: str) -> tuple[pl.DataFrame, list[pl.DataFrame]]:
-    groups = list(data.group_by(*by, maintain_order=True))
+    """Split the data into groups in the order of their first appearance.
 
-    if not groups:
-        return pl.DataFrame(schema=by), []
+    Returns the unique group keys, one row per group, and the partitions in
+    the same order. The keys are read from the first row of each partition,
+    so the data is only grouped once.
+    """
+    dfs = data.partition_by(*by, maintain_order=True)
+    rows = [df.row(0) for df in dfs]
+    positions = [data.get_column_index(c) for c in by]
+    keys = {c: [row[i] for row in rows] for c, i in zip(by, positions, strict=True)}
+    return pl.DataFrame(keys, schema=data.select(by).schema), dfs
 
-    names, dfs = zip(*groups, strict=True)
-    group = pl.DataFrame(list(names), schema=by, orient="row")
 
-    return group, list(dfs)
+def index(columns: list[str]) -> pl.Expr:
+    """Return a dense index of `columns` in the order of their first appearance.
 
-
-def with_index(data: pl.DataFrame, columns: list[str], name: str) -> pl.DataFrame:
+    The expression is evaluated on a group frame with an `INDEX` row index.
+    """
     if not columns:
-        return data.with_columns(pl.lit(0).alias(name))
-
-    return data.join(
-        data.select(columns).unique(maintain_order=True).with_row_index(name),
-        on=columns,
-        maintain_order="left",
-    )
+        return pl.lit(0)
+
+    return pl.col(INDEX).min().over(columns).rank("dense") - 1
+
+
+def select(
+    data: pl.DataFrame | pl.LazyFrame,
+    encoding: Encoding,
+    by: Iterable[str] = (),
+    extra: Mapping[str, pl.Expr] | None = None,
+) -> pl.LazyFrame:
+    """Build a lazy query that projects the data onto the encoded columns.
+
+    Aesthetic columns and the extra `by` columns (e.g. facets) keep their
+    names, while the x and y encodings are evaluated into the `X` and `Y`
+    columns, on the whole data or per group according to `Encoding.scope`.
+    `extra` adds further named expressions, e.g. a mark's weights. Columns
+    that are not used are never read from the source.
+
+    If y is an aggregation, e.g. `pl.col("v").mean()`, the query groups by x
+    and the key columns instead, with one row per group in the order of
+    first appearance. Extra expressions must then be aggregations too.
+    """
+    keys = sorted({*encoding.columns(), *by})
+    exprs = [pl.col(c) for c in keys]
+    extras = [expr.alias(name) for name, expr in (extra or {}).items()]
+
+    if encoding.aggregates():
+        if encoding.x is not None:
+            x = pl.col(encoding.x) if isinstance(encoding.x, str) else encoding.x
+            exprs.append(x.alias(X))
+
+        aggs = [cast("pl.Expr", encoding.y).alias(Y), *extras]
+        if not exprs:
+            return data.lazy().select(aggs)
+        return data.lazy().group_by(exprs, maintain_order=True).agg(aggs)
+
+    for name, value in ((X, encoding.x), (Y, encoding.y)):
+        if isinstance(value, pl.Expr) and encoding.scope == "group" and keys:
+            exprs.append(value.over(keys).alias(name))
+        elif value is not None:
+            expr = pl.col(value) if isinstance(value, str) else value
+            exprs.append(expr.alias(name))
+
+    return data.lazy().select([*exprs, *extras])
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from .data import X, Y
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from matplotlib.axes import Axes
+
+UNITS = {"d": 1, "ms": 86_400e3, "us": 86_400e6, "ns": 86_400e9}
+"""The number of physical units of each temporal dtype per day."""
+
+
+def to_dates(data: pl.LazyFrame) -> tuple[pl.LazyFrame, dict[str, str | None]]:
+    """Convert temporal `X` and `Y` columns to matplotlib date numbers.
+
+    Matplotlib dates are days since its epoch, in UTC. They are computed
+    from the physical epoch values of `Date` and `Datetime` columns with one
+    arithmetic expression each, instead of by matplotlib's converter.
+
+    Returns:
+        The converted data, and the time zone of each converted column, or
+        None for naive datetimes and dates.
+    """
+    schema = data.collect_schema()
+    zones: dict[str, str | None] = {}
+    exprs: list[pl.Expr] = []
+
+    for name in (X, Y):
+        dtype = schema.get(name)
+        if isinstance(dtype, pl.Datetime):
+            unit, zones[name] = dtype.time_unit, dtype.time_zone
+        elif isinstance(dtype, pl.Date):
+            unit, zones[name] = "d", None
+        else:
+            continue
+
+        expr = pl.col(name).to_physical() / UNITS[unit] + epoch()
+        exprs.append(expr.cast(pl.Float64).alias(name))
+
+    return (data.with_columns(exprs) if exprs else data), zones
+
+
+def epoch() -> float:
+    """Return the matplotlib date number of 1970-01-01, the Polars epoch."""
+    import numpy as np  # noqa: PLC0415
+    from matplotlib.dates import get_epoch  # noqa: PLC0415
+
+    origin = np.datetime64(get_epoch(), "us")  # pyright: ignore[reportUnknownArgumentType]
+    delta = np.datetime64("1970-01-01", "us") - origin
+    return float(delta / np.timedelta64(1, "D"))
+
+
+def set_date_axes(ax: Axes, zones: Mapping[str, str | None]) -> None:
+    """Install a date locator and formatter on the axes of converted columns."""
+    if not zones:
+        return
+
+    from matplotlib.dates import AutoDateLocator, ConciseDateFormatter  # noqa: PLC0415
+
+    for name, tz in zones.items():
+        axis = ax.xaxis if name == X else ax.yaxis
+        locator = AutoDateLocator(tz=tz)
+        axis.set_major_locator(locator)
+        axis.set_major_formatter(ConciseDateFormatter(locator, tz=tz))
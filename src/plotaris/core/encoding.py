@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+import polars as pl
 
 from plotaris.colors import COLORS
 
+from .scale import Scale
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
-    import polars as pl
-
-type Palette = dict[tuple[Any, ...], str] | dict[tuple[Any, ...], int]
+type Scope = Literal["data", "group"]
 
 
 @dataclass(frozen=True)
@@ -27,6 +29,14 @@ class Encoding:
     """The encoding for the size property."""
     shape: list[str] = field(default_factory=list)
     """The encoding for the shape property (e.g., for scatter plots)."""
+    scope: Scope = "data"
+    """Where expression encodings for x and y are evaluated.
+
+    With `"data"`, expressions are evaluated once on the whole data before it
+    is split into groups, so window expressions such as
+    `pl.col("v").rolling_mean(10)` run across group boundaries. With
+    `"group"`, they are wrapped in `.over()` of the aesthetic and facet
+    columns and evaluated per group, still in a single pass."""
 
     palette_names: ClassVar[list[str]] = ["color", "size", "shape"]
 
@@ -42,29 +52,30 @@ class Encoding:
             if value := getattr(self, name):
                 yield name, value
 
-    def create_palettes(self, data: pl.DataFrame) -> dict[str, Palette]:
-        """Create palettes (ordered lists of visual properties) for all aesthetics."""
-        palettes: dict[str, Palette] = {}
+    def aggregates(self) -> bool:
+        """Return whether y is an aggregation, such as `pl.col("v").mean()`.
+
+        Such an encoding yields one row per x value and aesthetic group.
+        """
+        return isinstance(self.y, pl.Expr) and self.y.meta.is_scalar()
+
+    def columns(self) -> list[str]:
+        """Return the sorted, unique columns used by all aesthetics."""
+        return sorted({c for _, cs in self.items() for c in cs})
+
+    def create_scales(self, data: pl.DataFrame) -> dict[str, Scale[Any]]:
+        """Create the scales of all aesthetics, once per chart."""
+        scales: dict[str, Scale[Any]] = {}
 
         if self.color:
-            palettes["color"] = create_palette(data, self.color, COLORS)
+            scales["color"] = Scale[str].from_data(data, self.color, COLORS)
 
         if self.size:
             sizes = [50, 100, 150, 200, 250]
-            palettes["size"] = create_palette(data, self.size, sizes)
+            scales["size"] = Scale[int].from_data(data, self.size, sizes)
 
         if self.shape:
             shapes = ["o", "s", "^", "D", "v"]
-            palettes["shape"] = create_palette(data, self.shape, shapes)
-
-        return palettes
-
+            scales["shape"] = Scale[str].from_data(data, self.shape, shapes)
 
-def create_palette[T](
-    data: pl.DataFrame,
-    columns: list[str],
-    palette: list[T],
-) -> dict[tuple[Any, ...], T]:
-    """Create an ordered palette of visual properties corresponding to unique data values."""  # noqa: E501
-    rows = data.select(columns).unique(maintain_order=True).rows()
-    return {row: palette[i % len(palette)] for i, row in enumerate(rows)}
+        return scales
@@ -1,21 +1,98 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
-import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
 
+from .categories import set_category_axes, to_codes
 from .data import GroupedData
+from .dates import set_date_axes
+from .profile import count_artists
+from .scale import with_codes
 
 if TYPE_CHECKING:
-    import numpy as np
-    import polars as pl
+    from collections.abc import Mapping
+
     from matplotlib.axes import Axes
     from matplotlib.figure import Figure
 
     from plotaris.marks.base import Mark
 
     from .encoding import Encoding
+    from .layout import Layout
+    from .profile import Profile
+    from .scale import Scale
+
+type Scales = Literal["fixed", "free_x", "free_y", "free"]
+type Share = bool | Literal["row", "col"]
+
+
+def expand(lo: float, hi: float, expander: float = 0.05) -> tuple[float, float]:
+    """Widen an empty interval, as matplotlib does when autoscaling."""
+    if lo != hi:
+        return lo, hi
+    if lo == 0:
+        return -expander, expander
+    return lo - expander * abs(lo), hi + expander * abs(hi)
+
+
+def finite(expr: pl.Expr) -> pl.Expr:
+    """Return the values of `expr` that are neither NaN nor infinite."""
+    return expr.filter(expr.is_finite())
+
+
+def to_string(expr: pl.Expr, dtype: pl.DataType) -> pl.Expr:
+    """Format the values of `expr` as `str` formats the Python values.
+
+    Booleans become `True` and `False`, and datetimes, times and durations
+    show fractional seconds only where they are nonzero. Nulls stay null.
+    """
+    if isinstance(dtype, pl.Boolean):
+        return expr.cast(pl.String).str.to_titlecase()
+
+    if isinstance(dtype, pl.Datetime | pl.Time):
+        fmt = "%Y-%m-%d %H:%M:%S" if isinstance(dtype, pl.Datetime) else "%H:%M:%S"
+        tz = "%:z" if isinstance(dtype, pl.Datetime) and dtype.time_zone else ""
+        return (
+            pl.when(expr.dt.microsecond() == 0)
+            .then(expr.dt.strftime(fmt + tz))
+            .otherwise(expr.dt.strftime(f"{fmt}%.6f{tz}"))
+        )
+
+    if isinstance(dtype, pl.Duration):
+        us = expr.dt.total_microseconds()
+        days = us // 86_400_000_000
+        seconds = (us - days * 86_400_000_000) // 1_000_000
+        fraction = us % 1_000_000
+        unit = (
+            pl.when(days.abs() == 1).then(pl.lit(" day, ")).otherwise(pl.lit(" days, "))
+        )
+        return pl.concat_str(
+            pl.when(days != 0).then(days.cast(pl.String) + unit).otherwise(pl.lit("")),
+            (seconds // 3600).cast(pl.String),
+            pl.lit(":"),
+            (seconds // 60 % 60).cast(pl.String).str.zfill(2),
+            pl.lit(":"),
+            (seconds % 60).cast(pl.String).str.zfill(2),
+            pl.when(fraction != 0)
+            .then(pl.lit(".") + fraction.cast(pl.String).str.zfill(6))
+            .otherwise(pl.lit("")),
+        )
+
+    return expr.cast(pl.String)
+
+
+def share_key(share: Share, row: int, col: int) -> tuple[int, int]:
+    """Return the key of the group of subplots that share an axis."""
+    if share is True:
+        return (0, 0)
+    if share == "row":
+        return (row, 0)
+    if share == "col":
+        return (0, col)
+    return (row, col)
 
 
 @dataclass
@@ -25,15 +102,36 @@ class FacetSpec:
     row: list[str] | None = None
     col: list[str] | None = None
     wrap: int | None = None
+    sparse: bool = False
+    """Create subplots only for the row and column combinations in the
+    data. Wrapped grids are always sparse."""
+    scales: Scales = "fixed"
+    """Whether the x and y limits are the same for all panels or free. Free
+    limits are shared along the grid columns (x) and rows (y), and are per
+    panel in wrapped grids."""
+
+    def columns(self) -> list[str]:
+        """Return the row and column facet variables."""
+        return [*(self.row or []), *(self.col or [])]
 
 
 class FacetGrid:
     data: pl.DataFrame
     encoding: Encoding
     facet_spec: FacetSpec
+    scales: dict[str, Scale[Any]]
+    categories: dict[str, list[str]]
+    """The categories of categorical x and y, whose codes replace them."""
+    profile: Profile | None
+    """Where the stages of creating and plotting the grid are recorded."""
     gd: GroupedData
+    cells: list[tuple[int, int]]
+    """The row and column of the panel of each facet group."""
+    layout: Layout
     fig: Figure
     axes: np.ndarray[Any, Any]
+    """The subplots by row and column. Cells without a subplot in a sparse
+    grid hold None."""
     nrows: int
     ncols: int
 
@@ -42,69 +140,259 @@ class FacetGrid:
         data: pl.DataFrame,
         encoding: Encoding,
         facet_spec: FacetSpec,
+        profile: Profile | None = None,
+        fig: Figure | None = None,
     ) -> None:
-        self.data = data
+        """Create the grid for data collected with `Chart.collect`.
+
+        With a `profile`, the stages of creating and plotting the grid are
+        recorded in it. The subplots are added to `fig`, which is resized to
+        the layout, or to a new pyplot figure.
+        """
+        # Create scales and categories from the unsplit data for consistency
+        # across panels
+        self.scales = encoding.create_scales(data)
+        self.data, self.categories = to_codes(with_codes(data, self.scales))
         self.encoding = encoding
         self.facet_spec = facet_spec
+        self.profile = profile
+        if profile:
+            groups = sum(len(scale) for scale in self.scales.values())
+            profile.lap("scales", rows=len(data), groups=groups)
 
-        # Combine aesthetic and facet mappings for GroupedData
-        full_mapping = dict(encoding.items())
+        # Group by the facet variables only; marks handle the aesthetics
+        mapping: dict[str, list[str]] = {}
         if facet_spec.row:
-            full_mapping["row"] = facet_spec.row
+            mapping["row"] = facet_spec.row
         if facet_spec.col:
-            full_mapping["col"] = facet_spec.col
-        self.gd = GroupedData(self.data, full_mapping)
-
-        # Calculate grid dimensions
-        self.nrows = self.gd.n_unique("row") or 1
-        self.ncols = self.gd.n_unique("col") or 1
-
-        # Create the subplot grid
-        self.fig, self.axes = plt.subplots(  # pyright: ignore[reportUnknownMemberType]
-            self.nrows,
-            self.ncols,
-            sharex=True,
-            sharey=True,
-            squeeze=False,  # Ensure axes is always a 2D array
+            mapping["col"] = facet_spec.col
+        self.gd = GroupedData(self.data, mapping)
+        if profile:
+            profile.lap("group_by", rows=len(data), groups=len(self.gd))
+
+        # Place the panels and calculate grid dimensions
+        self.cells = self._place()
+        self.nrows = max((r for r, _ in self.cells), default=0) + 1
+        self.ncols = max((c for _, c in self.cells), default=0) + 1
+
+        # Create the subplot grid with a layout computed from font sizes
+        from .layout import Layout  # noqa: PLC0415
+
+        self.layout = Layout.create(self.nrows, self.ncols)
+        if fig is None:
+            import matplotlib.pyplot as plt  # noqa: PLC0415
+
+            fig = plt.figure(figsize=self.layout.figsize)  # pyright: ignore[reportUnknownMemberType]
+        else:
+            fig.set_size_inches(self.layout.figsize)
+        self.fig = fig
+        self.fig.subplots_adjust(**self.layout.subplot_params())
+
+        sharex, sharey = self.sharing()
+        if facet_spec.sparse or facet_spec.wrap:
+            self.axes = self._create_sparse(sharex, sharey)
+        else:
+            self.axes = self.fig.subplots(
+                self.nrows,
+                self.ncols,
+                sharex=sharex,
+                sharey=sharey,
+                squeeze=False,  # Ensure axes is always a 2D array
+            )
+        if profile:
+            profile.lap("subplots", groups=len(self.cells))
+
+    def sharing(self) -> tuple[Share, Share]:
+        """Return how the x and y axes are shared, as for `plt.subplots`."""
+        scales = self.facet_spec.scales
+        wrap = bool(self.facet_spec.wrap)
+        sharex = scales in ("fixed", "free_y") or (False if wrap else "col")
+        sharey = scales in ("fixed", "free_x") or (False if wrap else "row")
+        return sharex, sharey
+
+    def _create_sparse(self, sharex: Share, sharey: Share) -> np.ndarray[Any, Any]:
+        """Create one subplot per cell in `cells`.
+
+        Subplots share the axes of the first subplot in their sharing group.
+        A subplot shows its x tick labels if no subplot sharing its x axis
+        is below it, and its y tick labels if none sharing its y axis is left
+        of it.
+        """
+        gs = self.fig.add_gridspec(self.nrows, self.ncols)  # pyright: ignore[reportUnknownMemberType]
+        axes = np.full((self.nrows, self.ncols), None, dtype=object)
+
+        cells = pl.DataFrame(self.cells, schema=["row", "col"], orient="row")
+        outer = cells.select(
+            bottom=(pl.col("row") == pl.col("row").max().over("col")) | (not sharex),
+            left=(pl.col("col") == pl.col("col").min().over("row")) | (not sharey),
         )
 
-    def plot(self, mark: Mark, encoding: Encoding) -> None:
-        """Plot the data on the grid."""
-        # Create palettes from the original, unsplit data for consistent scales
-        palettes = encoding.create_palettes(self.data)
+        first: dict[tuple[str, Any], Axes] = {}
+        for (i, j), (bottom, left) in zip(self.cells, outer.rows(), strict=True):
+            kx, ky = ("x", share_key(sharex, i, j)), ("y", share_key(sharey, i, j))
+            ax = self.fig.add_subplot(
+                gs[i, j],
+                sharex=first.get(kx),
+                sharey=first.get(ky),
+            )
+            ax.tick_params(labelbottom=bottom, labelleft=left)  # pyright: ignore[reportUnknownMemberType]
+            first.setdefault(kx, ax)
+            first.setdefault(ky, ax)
+            axes[i, j] = ax
+
+        return axes
+
+    def _place(self) -> list[tuple[int, int]]:
+        """Return the cell of each facet group, wrapping a single facet.
+
+        With `wrap`, column facets fill rows of at most `wrap` panels, and
+        row facets fill columns of at most `wrap` panels.
+        """
+        group = self.gd.group
+        row = pl.col("row") if "row" in group.columns else pl.lit(0)
+        col = pl.col("col") if "col" in group.columns else pl.lit(0)
+
+        if wrap := self.facet_spec.wrap:
+            if self.facet_spec.row and self.facet_spec.col:
+                msg = "Facet wrap requires either row or col, not both"
+                raise ValueError(msg)
+
+            if self.facet_spec.col:
+                row, col = col // wrap, col % wrap
+            else:
+                row, col = row % wrap, row // wrap
+
+        return group.select(row.alias("row"), col.alias("col")).rows()
+
+    def plot(self, mark: Mark, zones: Mapping[str, str | None] | None = None) -> None:
+        """Plot the data on the grid.
+
+        `zones` holds the time zone of the x and y columns that hold
+        matplotlib dates, as returned by `to_dates`, to format their axes.
+        """
+        profile = self.profile
+        titles = self.titles()
+        if profile:
+            profile.lap("titles", groups=len(titles))
+
+        # Fix the limits first, so that no drawing triggers autoscaling
+        self.set_limits(mark)
+        if profile:
+            profile.lap("limits", rows=len(self.data))
 
         for i, df_group in enumerate(self.gd.data):
             # Determine which subplot (ax) to draw on
-            row_idx = self.gd.group["row"][i] if "row" in self.gd.group.columns else 0
-            col_idx = self.gd.group["col"][i] if "col" in self.gd.group.columns else 0
-            ax = self.axes[row_idx, col_idx]
-
-            # Calculate kwargs for this group's aesthetics
-            kwargs = {}
-            for name, palette in palettes.items():
-                # The key for the palette is the tuple of actual categorical values
-                key = df_group.select(encoding.get(name)).row(0)
-                kwargs[name] = palette[key]
-
-            # Get x,y data for this group and plot
-            x = df_group.select(encoding.x).to_series()
-            y = df_group.select(encoding.y).to_series()
-            mark.plot(ax=ax, x=x, y=y, **kwargs)
-
-            # Set the title for the subplot
-            self._set_title(ax, i)
-
-        # Final layout adjustments
-        self.fig.tight_layout()
-
-    def _set_title(self, ax: Axes, group_index: int) -> None:
-        """Set the title for a single subplot based on its facet values."""
-        parts: list[str] = []
-        if "row" in self.gd.mapping:
-            row_vals = self.gd.item(group_index, "row", named=True)
-            parts.append(", ".join(f"{k}={v}" for k, v in row_vals.items()))
-        if "col" in self.gd.mapping:
-            col_vals = self.gd.item(group_index, "col", named=True)
-            parts.append(", ".join(f"{k}={v}" for k, v in col_vals.items()))
-
-        ax.set_title(" | ".join(parts))  # pyright: ignore[reportUnknownMemberType]
+            ax = self.axes[self.cells[i]]
+
+            # Draw all aesthetic groups of this panel
+            mark.draw(ax, df_group, self.scales)
+
+            ax.set_title(titles[i])
+
+        if profile:
+            artists = sum(count_artists(ax) for ax in self.fig.axes)
+            profile.lap(
+                "draw",
+                rows=len(self.data),
+                groups=len(self.gd),
+                artists=artists,
+            )
+
+        for ax in self.fig.axes:
+            set_date_axes(ax, zones or {})
+            set_category_axes(ax, self.categories)
+
+        # Refine the computed layout by measuring text for small grids only
+        if self.layout.tight:
+            self.fig.tight_layout()
+            if profile:
+                profile.lap("tight_layout")
+
+    def set_limits(self, mark: Mark) -> None:
+        """Set the axis limits from the data and turn off autoscaling.
+
+        The extent of each facet group comes from one aggregation over the
+        data, and is combined per sharing group of the axes. NaN and
+        infinite values are ignored, as matplotlib does. Margins follow
+        `rcParams`. Axes are left to autoscale if the mark has no `limits`
+        or the values are not numeric.
+        """
+        if (limits := mark.limits()) is None or self.data.is_empty():
+            return
+
+        by = self.facet_spec.columns()
+        schema = self.data.lazy().select(*limits).collect_schema()
+        aggs = {
+            f"_{axis}{i}": agg
+            for axis, expr, dtype in zip("xy", limits, schema.dtypes(), strict=True)
+            if dtype.is_numeric()
+            for i, agg in enumerate([finite(expr).min(), finite(expr).max()])
+        }
+        if not aggs:
+            return
+
+        from matplotlib import rcParams  # noqa: PLC0415
+
+        cells = pl.DataFrame(self.cells, schema=["_row", "_col"], orient="row")
+        panels = (
+            pl.concat([self.gd.keys, cells], how="horizontal")
+            .with_row_index("_panel")
+            .join(
+                self.data.group_by(by).agg(**aggs),
+                on=by,
+                how="left",
+                nulls_equal=True,
+                maintain_order="left",
+            )
+        )
+
+        keys: dict[Share, pl.Expr] = {
+            True: pl.lit(0),
+            "col": pl.col("_col"),
+            "row": pl.col("_row"),
+            False: pl.col("_panel"),
+        }
+
+        for axis, share in zip("xy", self.sharing(), strict=True):
+            if f"_{axis}0" not in panels.columns:
+                continue
+
+            # One panel per sharing group, since limits propagate to siblings
+            extents = panels.group_by(keys[share].alias("_key")).agg(
+                pl.col("_row", "_col").first(),
+                lo=pl.col(f"_{axis}0").min(),
+                hi=pl.col(f"_{axis}1").max(),
+            )
+            margin = rcParams["axes.xmargin" if axis == "x" else "axes.ymargin"]
+
+            rows = extents.select("_row", "_col", "lo", "hi").iter_rows()
+            for row, col, vmin, vmax in rows:
+                if vmin is None or vmax is None:
+                    continue
+
+                lo, hi = expand(vmin, vmax)
+                pad = margin * (hi - lo)
+                ax: Axes = self.axes.item(row, col)
+                set_lim = ax.set_xlim if axis == "x" else ax.set_ylim
+                set_lim(lo - pad, hi + pad, auto=False)
+
+    def titles(self) -> list[str]:
+        """Return the title of each facet group, e.g. `"a=1, b=x | c=2"`.
+
+        The titles are formatted from the group keys in one expression, with
+        the values shown as `str` shows them.
+        """
+        schema = self.gd.keys.schema
+        parts = [
+            pl.concat_str(
+                [
+                    pl.lit(f"{c}=") + to_string(pl.col(c), schema[c]).fill_null("None")
+                    for c in self.gd.mapping[name]
+                ],
+                separator=", ",
+            )
+            for name in ("row", "col")
+            if name in self.gd.mapping
+        ]
+        titles = self.gd.keys.select(pl.concat_str(parts, separator=" | "))
+        return titles.to_series().to_list()
@@ -1,123 +1,92 @@
-# from __future__ import annotations
-
-# from typing import TYPE_CHECKING, Any
-
-# import matplotlib.pyplot as plt
-
-# if TYPE_CHECKING:
-#     from collections.abc import Iterable
-
-#     import numpy as np
-#     import polars as pl
-#     from matplotlib.axes import Axes
-#     from matplotlib.figure import Figure
-
-#     from .grid import Facet
-
-
-# class LayoutManager:
-#     """Manages the layout of a faceted chart grid."""
-
-#     def __init__(
-#         self,
-#         data: pl.DataFrame,
-#         facet: Facet,
-#         *,
-#         sharex: bool = True,
-#         sharey: bool = True,
-#     ) -> None:
-#         if facet.row is None and facet.col is None:
-#             msg = "Facet information is missing."
-#             raise ValueError(msg)
-
-#         self.data = data
-#         self.facet = facet
-#         self.sharex = sharex
-#         self.sharey = sharey
-
-#         # Lazy properties
-#         self._row_keys: list[Any] | None = None
-#         self._col_keys: list[Any] | None = None
-
-#     @property
-#     def row_keys(self) -> list[Any]:
-#         """Get unique, sorted keys for facet rows."""
-#         if self._row_keys is None:
-#             if self.facet.row:
-#                 self._row_keys = (
-#                     self.data.get_column(self.facet.row)
-#                     .unique(maintain_order=True)
-#                     .to_list()
-#                 )
-#             else:
-#                 self._row_keys = []
-#         return self._row_keys
-
-#     @property
-#     def col_keys(self) -> list[Any]:
-#         """Get unique, sorted keys for facet columns."""
-#         if self._col_keys is None:
-#             if self.facet.col:
-#                 self._col_keys = (
-#                     self.data.get_column(self.facet.col)
-#                     .unique(maintain_order=True)
-#                     .to_list()
-#                 )
-#             else:
-#                 self._col_keys = []
-#         return self._col_keys
-
-#     @property
-#     def n_rows(self) -> int:
-#         """Get the number of rows in the facet grid."""
-#         return len(self.row_keys) if self.facet.row else 1
-
-#     @property
-#     def n_cols(self) -> int:
-#         """Get the number of columns in the facet grid."""
-#         return len(self.col_keys) if self.facet.col else 1
-
-#     def create_figure(self) -> tuple[Figure, np.ndarray[Any, Any]]:
-#         """Create the figure and axes grid for the facet plot."""
-#         fig, axes = plt.subplots(
-#             nrows=self.n_rows,
-#             ncols=self.n_cols,
-#             sharex=self.sharex,
-#             sharey=self.sharey,
-#             squeeze=False,  # Always return a 2D array for consistent indexing
-#         )
-#         return fig, axes
-
-#     def iter_subplots(
-#         self,
-#         axes: np.ndarray[Any, Any],
-#     ) -> Iterable[tuple[pl.DataFrame, Axes, dict[str, Any], int, int]]:
-#         import polars as pl
-
-#         row_facet = self.facet.row
-#         col_facet = self.facet.col
-
-#         if row_facet and col_facet:
-#             for i, row_key in enumerate(self.row_keys):
-#                 for j, col_key in enumerate(self.col_keys):
-#                     ax = axes[i, j]
-#                     titles = {
-#                         "title": f"{col_facet} = {col_key}",
-#                         "ylabel": f"{row_facet} = {row_key}",
-#                     }
-#                     subset = self.data.filter(
-#                         (pl.col(row_facet) == row_key) & (pl.col(col_facet) == col_key),  # noqa: E501
-#                     )
-#                     yield subset, ax, titles, i, j
-#         elif row_facet:
-#             for i, row_key in enumerate(self.row_keys):
-#                 ax = axes[i, 0]
-#                 titles = {"ylabel": f"{row_facet} = {row_key}"}
-#                 subset = self.data.filter(pl.col(row_facet) == row_key)
-#                 yield subset, ax, titles, i, 0
-#         elif col_facet:
-#             for j, col_key in enumerate(self.col_keys):
-#                 ax = axes[0, j]
-#                 titles = {"title": f"{col_facet} = {col_key}"}
-#                 subset = self.data.filter(pl.col(col_facet) == col_key)
-#                 yield subset, ax, titles, 0, j
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from matplotlib import rcParams
+from matplotlib.font_manager import FontProperties
+
+PAD = 0.1
+"""The gap in inches between panels and around the grid."""
+TICK_LABEL_CHARS = 4
+"""The number of characters assumed for the width of a y tick label."""
+TIGHT_LAYOUT_MAX_PANELS = 16
+"""Grids with more panels skip `tight_layout`, which measures every text."""
+
+
+@dataclass(frozen=True)
+class Layout:
+    """The size and subplot parameters of a facet grid figure.
+
+    The layout is computed from the figure size and font sizes in `rcParams`,
+    as set by `plotaris.init`, without drawing any text. Each panel is as
+    large as the axes of a single chart, and the margins fit one line of
+    title above each panel and the tick labels of the outer panels.
+    """
+
+    nrows: int
+    ncols: int
+    figsize: tuple[float, float]
+    """The size of the figure in inches."""
+    left: float
+    right: float
+    bottom: float
+    top: float
+    wspace: float
+    hspace: float
+
+    @classmethod
+    def create(cls, nrows: int, ncols: int) -> Layout:
+        rc = rcParams
+        width, height = rc["figure.figsize"]
+        panel_w = width * (rc["figure.subplot.right"] - rc["figure.subplot.left"])
+        panel_h = height * (rc["figure.subplot.top"] - rc["figure.subplot.bottom"])
+
+        # Text extents in inches, from font sizes in points
+        title = (1.2 * points(rc["axes.titlesize"]) + rc["axes.titlepad"]) / 72
+        xtick = 1.2 * points(rc["xtick.labelsize"])
+        xtick = (xtick + rc["xtick.major.size"] + rc["xtick.major.pad"]) / 72
+        ytick = TICK_LABEL_CHARS * 0.6 * points(rc["ytick.labelsize"])
+        ytick = (ytick + rc["ytick.major.size"] + rc["ytick.major.pad"]) / 72
+
+        left = ytick + PAD
+        right = PAD
+        bottom = xtick + PAD
+        top = title + PAD
+        wgap = 2 * PAD
+        hgap = title + PAD
+
+        fig_w = left + ncols * panel_w + (ncols - 1) * wgap + right
+        fig_h = bottom + nrows * panel_h + (nrows - 1) * hgap + top
+
+        return cls(
+            nrows,
+            ncols,
+            (fig_w, fig_h),
+            left=left / fig_w,
+            right=1 - right / fig_w,
+            bottom=bottom / fig_h,
+            top=1 - top / fig_h,
+            wspace=wgap / panel_w,
+            hspace=hgap / panel_h,
+        )
+
+    @property
+    def tight(self) -> bool:
+        """Whether the grid is small enough to refine with `tight_layout`."""
+        return self.nrows * self.ncols <= TIGHT_LAYOUT_MAX_PANELS
+
+    def subplot_params(self) -> dict[str, float]:
+        """Return the keyword arguments of `Figure.subplots_adjust`."""
+        return {
+            "left": self.left,
+            "right": self.right,
+            "bottom": self.bottom,
+            "top": self.top,
+            "wspace": self.wspace,
+            "hspace": self.hspace,
+        }
+
+
+def points(size: float | str) -> float:
+    """Return a font size, which may be relative like `"large"`, in points."""
+    return FontProperties(size=size).get_size_in_points()
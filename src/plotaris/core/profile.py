@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, override
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+@dataclass(frozen=True)
+class Stage:
+    """The wall time and sizes of one stage of drawing a chart."""
+
+    name: str
+    seconds: float
+    rows: int | None = None
+    """The number of rows the stage processed."""
+    groups: int | None = None
+    """The number of groups, e.g. scale keys or facet panels."""
+    artists: int | None = None
+    """The number of artists the stage added."""
+
+
+@dataclass
+class Profile:
+    """The stages of one `Chart.display` or `Chart.render`, in order.
+
+    Stages are recorded like laps of a stopwatch: each one lasts from the
+    end of the previous stage, or the creation of the profile, until it is
+    recorded with `lap`.
+    """
+
+    stages: list[Stage] = field(default_factory=list[Stage])
+    _last: float = field(default_factory=time.perf_counter, repr=False)
+
+    def lap(
+        self,
+        name: str,
+        *,
+        rows: int | None = None,
+        groups: int | None = None,
+        artists: int | None = None,
+    ) -> None:
+        """Record a stage that ends now."""
+        now = time.perf_counter()
+        self.stages.append(Stage(name, now - self._last, rows, groups, artists))
+        self._last = now
+
+    @property
+    def seconds(self) -> float:
+        """The total wall time of all stages."""
+        return sum(stage.seconds for stage in self.stages)
+
+    @override
+    def __str__(self) -> str:
+        def fmt(value: int | None) -> str:
+            return "" if value is None else str(value)
+
+        lines = [f"{'stage':<14}{'seconds':>10}{'rows':>12}{'groups':>9}{'artists':>9}"]
+        for s in [*self.stages, Stage("total", self.seconds)]:
+            counts = f"{fmt(s.rows):>12}{fmt(s.groups):>9}{fmt(s.artists):>9}"
+            lines.append(f"{s.name:<14}{s.seconds:>10.4f}{counts}".rstrip())
+        return "\n".join(lines)
+
+
+def count_artists(ax: Axes) -> int:
+    """Return the number of data artists of an axes."""
+    return len(ax.collections) + len(ax.lines) + len(ax.patches) + len(ax.images)
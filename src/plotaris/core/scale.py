@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+CODE = "_code"
+"""The column name of the integer code in a scale's domain."""
+
+
+def code(name: str) -> str:
+    """Return the column name holding the codes of the scale `name`."""
+    return f"_{name}"
+
+
+@dataclass(frozen=True)
+class Scale[T]:
+    """Map the unique keys of some columns to visual values by integer code.
+
+    The domain holds each key once, in the order of first appearance, with
+    its code in the `CODE` column. The value of code `i` is
+    `values[i % len(values)]`.
+    """
+
+    columns: list[str]
+    """The columns whose unique rows form the domain."""
+    domain: pl.DataFrame
+    """The unique keys and their codes."""
+    values: list[T]
+    """The visual values, reused cyclically if the domain is larger."""
+
+    @classmethod
+    def from_data(
+        cls,
+        data: pl.DataFrame,
+        columns: list[str],
+        values: list[T],
+    ) -> Scale[T]:
+        """Create a scale whose domain is the unique keys of the data."""
+        domain = data.select(columns).unique(maintain_order=True).with_row_index(CODE)
+        return cls(columns, domain, values)
+
+    def extend(self, data: pl.DataFrame) -> Scale[T]:
+        """Return the scale with the new keys of the data added.
+
+        New keys get the next codes in the order of first appearance, so
+        the codes of existing keys, and the values they map to, are kept.
+        """
+        keys = (
+            data.select(self.columns)
+            .unique(maintain_order=True)
+            .join(
+                self.domain,
+                on=self.columns,
+                how="anti",
+                maintain_order="left",
+                nulls_equal=True,
+            )
+        )
+        if keys.is_empty():
+            return self
+
+        keys = keys.with_row_index(CODE, offset=len(self.domain))
+        return replace(self, domain=pl.concat([self.domain, keys]))
+
+    def __len__(self) -> int:
+        return len(self.domain)
+
+    def value(self, code: int) -> T:
+        """Return the visual value of a code."""
+        return self.values[code % len(self.values)]
+
+    def lookup(
+        self,
+        codes: pl.Series,
+        values: np.ndarray[Any, Any] | None = None,
+    ) -> np.ndarray[Any, Any]:
+        """Return the visual values of many codes as an array.
+
+        `values` may hold the visual values in another form, e.g. converted
+        to RGBA, with the same length as `self.values`.
+        """
+        values = np.asarray(self.values) if values is None else values
+        return values[codes.to_numpy() % len(self.values)]
+
+    def encode(self, data: pl.DataFrame, name: str = CODE) -> pl.Series:
+        """Return the code of each row of the data, via one join."""
+        domain = self.domain.rename({CODE: name})
+        return (
+            data.select(self.columns)
+            .join(
+                domain,
+                on=self.columns,
+                how="left",
+                maintain_order="left",
+                nulls_equal=True,
+            )
+            .get_column(name)
+        )
+
+
+def with_codes(data: pl.DataFrame, scales: Mapping[str, Scale[Any]]) -> pl.DataFrame:
+    """Add the code column of each scale to the data."""
+    return data.with_columns(
+        scale.encode(data, code(name)) for name, scale in scales.items()
+    )
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import polars as pl
+
+from .data import INDEX, X, Y
+
+
+def over(expr: pl.Expr, by: list[str]) -> pl.Expr:
+    """Evaluate `expr` per group of `by`, or on the whole frame if `by` is empty."""
+    return expr.over(by) if by else expr
+
+
+def gaps(data: pl.DataFrame, by: list[str]) -> pl.Expr:
+    """Return whether a row starts a run of null x or y values, or borders one.
+
+    Decimation keeps these rows, so that lines still break at the nulls and
+    stop and resume at the same points.
+    """
+    if not (data[X].has_nulls() or data[Y].has_nulls()):
+        return pl.lit(value=False)
+
+    missing = pl.col(X).is_null() | pl.col(Y).is_null()
+    before = over(missing.shift(1), by).fill_null(value=False)
+    after = over(missing.shift(-1), by).fill_null(value=False)
+    return (missing & ~before) | (~missing & (before | after))
+
+
+def decimate_minmax(data: pl.DataFrame, by: list[str], n_buckets: int) -> pl.DataFrame:
+    """Keep the first, last, minimum and maximum y points of each x bucket.
+
+    The x range of each group of `by` is split into `n_buckets` equal-width
+    buckets, e.g. one per horizontal pixel, so that the vertical extent drawn
+    in each pixel column is preserved, and the line joins up across bucket
+    edges. Rows with null x or y are kept where they break the line. Groups
+    with at most `4 * n_buckets` points and the row order are kept as they
+    are.
+    """
+    x = pl.col(X)
+    lo, hi = over(x.min(), by), over(x.max(), by)
+    bucket = ((x - lo) / (hi - lo) * n_buckets).floor().fill_nan(0)
+    bucket = bucket.clip(0, n_buckets - 1).cast(pl.Int64)
+    position = over(pl.int_range(pl.len(), dtype=pl.Int64), by)
+    is_small = over(pl.len(), by) <= 4 * n_buckets
+
+    data = data.with_row_index(INDEX)
+    buckets = data.with_columns(
+        _bucket=pl.when(is_small).then(position).otherwise(bucket),
+        _gap=gaps(data, by),
+    )
+
+    index = pl.col(INDEX)
+    points = buckets.filter(x.is_not_null() & pl.col(Y).is_not_null())
+    extrema = points.group_by([*by, "_bucket"]).agg(
+        _first=index.first(),
+        _last=index.last(),
+        _min=index.get(pl.col(Y).arg_min()),
+        _max=index.get(pl.col(Y).arg_max()),
+    )
+    keep = pl.concat(
+        [
+            *extrema.select("_first", "_last", "_min", "_max"),
+            buckets.filter("_gap")[INDEX],
+        ],
+    )
+
+    return data[keep.unique().sort()].drop(INDEX)
+
+
+def decimate_lttb(data: pl.DataFrame, by: list[str], n_out: int) -> pl.DataFrame:
+    """Keep about `n_out` points per group with Largest-Triangle-Three-Buckets.
+
+    The first and last points of each group of `by` are kept, and the other
+    rows are split into `n_out - 2` buckets of equal size. Each bucket keeps
+    the point that forms the largest triangle with the centroids of its
+    neighbouring buckets. Unlike the sequential algorithm, the previous
+    bucket is represented by its centroid rather than by its selected point,
+    so all buckets are reduced in one Polars pass. Rows with null x or y
+    are kept where they break the line, as by `decimate_minmax`.
+    """
+    n_out = max(n_out, 3)
+    n = over(pl.len(), by)
+    position = over(pl.int_range(pl.len()), by)
+    keys = [*by, "_bucket"]
+
+    bucket = (
+        pl.when(position == 0)
+        .then(0)
+        .when(position == n - 1)
+        .then(n_out - 1)
+        .otherwise((position - 1) * (n_out - 2) // (n - 2) + 1)
+    )
+    data = data.with_row_index(INDEX).with_columns(
+        _bucket=bucket,
+        _small=(n <= n_out) | gaps(data, by),
+    )
+
+    centroid = pl.col("_cx", "_cy")
+    centroids = (
+        data.group_by(keys)
+        .agg(_cx=pl.col(X).mean(), _cy=pl.col(Y).mean())
+        .sort(keys)
+        .with_columns(
+            over(centroid.shift(1), by).name.suffix("_prev").fill_null(centroid),
+            over(centroid.shift(-1), by).name.suffix("_next").fill_null(centroid),
+        )
+    )
+
+    ax, ay = pl.col("_cx_prev"), pl.col("_cy_prev")
+    cx, cy = pl.col("_cx_next"), pl.col("_cy_next")
+    area = ((ax - cx) * (pl.col(Y) - ay) - (ax - pl.col(X)) * (cy - ay)).abs()
+
+    index = pl.col(INDEX)
+    is_largest = index == index.get(area.arg_max()).over(keys)
+
+    return (
+        data.join(centroids, on=keys, how="left", maintain_order="left")
+        .filter(is_largest | pl.col("_small"))
+        .select(data.columns)
+        .drop(INDEX, "_bucket", "_small")
+    )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from .bar import BarMark
+from .density import DensityMark
+from .hist import HistMark
 from .line import LineMark
 from .point import PointMark
 
-__all__ = ["BarMark", "LineMark", "PointMark"]
+__all__ = ["BarMark", "DensityMark", "HistMark", "LineMark", "PointMark"]
@@ -1,15 +1,154 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, override
+from typing import TYPE_CHECKING, Any, Literal, override
 
-from .base import Mark
+import numpy as np
+import polars as pl
+
+from plotaris.core.data import X, Y
+from plotaris.core.scale import code
+
+from .base import Mark, to_numpy
 
 if TYPE_CHECKING:
-    import polars as pl
+    from collections.abc import Mapping
+
     from matplotlib.axes import Axes
 
+    from plotaris.core.scale import Scale
+
+    from .base import Array
+
+type Position = Literal["identity", "stack", "dodge"]
+type Agg = Literal["count", "sum", "mean", "median", "min", "max"]
+
 
 class BarMark(Mark):
+    position: Position
+    agg: Agg | None
+    """The statistic of y per x value and group, or None to draw the rows
+    as they are."""
+
+    def __init__(
+        self,
+        *,
+        position: Position = "identity",
+        agg: Agg | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.position = position
+        self.agg = agg
+
+    @override
+    def transform(self, data: pl.LazyFrame, by: list[str]) -> pl.LazyFrame:
+        """Aggregate y per x value and group with `agg`, in one `group_by`.
+
+        The bars keep the order of the first appearance of their x values.
+        """
+        if self.agg is None:
+            return data
+
+        stat = self.statistic(data, self.agg)
+        return data.group_by([X, *by], maintain_order=True).agg(stat.alias(Y))
+
+    @staticmethod
+    def statistic(data: pl.LazyFrame, agg: Agg) -> pl.Expr:
+        """Return the expression aggregating y with `agg`."""
+        if agg == "count":
+            return pl.len()
+        if Y in data.collect_schema():
+            return getattr(pl.col(Y), agg)()
+
+        msg = f"Aggregation '{agg}' requires a y encoding"
+        raise ValueError(msg)
+
+    @override
+    def limits(self) -> None:
+        return None
+
+    @override
+    def appendable(self) -> bool:
+        return self.position == "identity" and self.agg is None
+
+    @override
+    def draw(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+    ) -> None:
+        """Draw all groups with a single `bar` call.
+
+        Stacked and dodged positions are computed in Polars, and the colors
+        are resolved into one array with a row per bar. Other aesthetics
+        fall back to one `bar` call per group, which cannot stack or dodge.
+        """
+        if data.is_empty():
+            return
+
+        if not scales.keys() <= {"color"}:
+            if self.position != "identity":
+                msg = f"Bars with position '{self.position}' support only color"
+                raise ValueError(msg)
+
+            super().draw(ax, data, scales)
+            return
+
+        kwargs = dict(self.kwargs)
+        kwargs.pop("width", None)
+        width = self.width(data)
+        n_groups = 1
+        data = data.with_columns(_group=pl.lit(0))
+
+        if colors := scales.get("color"):
+            from matplotlib.colors import to_rgba_array  # noqa: PLC0415
+
+            data = data.with_columns(_group=pl.col(code("color")))
+            n_groups = len(colors)
+            rgba = to_rgba_array(colors.values)
+            kwargs["color"] = colors.lookup(data["_group"], rgba)
+
+        data = self.locate(data, width, n_groups)
+
+        ax.bar(  # pyright: ignore[reportUnknownMemberType]
+            to_numpy(data[X]),
+            np.ma.filled(to_numpy(data[Y]), np.nan),
+            width=to_numpy(data["_width"]),
+            bottom=np.ma.filled(to_numpy(data["_bottom"]), np.nan),
+            **kwargs,
+        )
+
+    def width(self, data: pl.DataFrame) -> float:  # noqa: ARG002  # pyright: ignore[reportUnusedParameter]
+        """Return the width of the bars, given by the `width` keyword argument."""
+        return self.kwargs.get("width", 0.8)
+
+    def locate(self, data: pl.DataFrame, width: float, n_groups: int) -> pl.DataFrame:
+        """Add the `_bottom` and `_width` columns and shift `X` for the position.
+
+        `data` must have a `_group` column with the color code of each row,
+        so that stacks and dodges are ordered the same in every facet.
+        """
+        bottom = pl.lit(0)
+
+        if self.position == "stack":
+            bottom = pl.col(Y).cum_sum().over(X, order_by="_group") - pl.col(Y)
+
+        elif self.position == "dodge":
+            if not data[X].dtype.is_numeric():
+                msg = "Dodged bars require a numeric x encoding"
+                raise ValueError(msg)
+
+            offset = (pl.col("_group") - (n_groups - 1) / 2) * width / n_groups
+            return data.with_columns(
+                pl.col(X) + offset,
+                _bottom=bottom,
+                _width=pl.lit(width / n_groups),
+            )
+
+        return data.with_columns(_bottom=bottom, _width=pl.lit(width))
+
     @override
-    def _plot(self, ax: Axes, *, x: pl.Series, y: pl.Series, **kwargs: Any) -> None:
-        ax.bar(x, y, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+    def _plot(self, ax: Axes, *, x: Array, y: Array, **kwargs: Any) -> Any:
+        y = np.ma.filled(y, np.nan)
+        return ax.bar(x, y, **kwargs)  # pyright: ignore[reportUnknownMemberType]
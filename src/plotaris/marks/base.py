@@ -3,10 +3,64 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import numpy as np
+import polars as pl
+
+from plotaris.core.data import GroupedData, X, Y
+from plotaris.core.scale import code
+
 if TYPE_CHECKING:
-    import polars as pl
+    from collections.abc import Mapping
+
     from matplotlib.axes import Axes
 
+    from plotaris.core.scale import Scale
+
+type Array = np.ndarray[Any, Any]
+
+
+def to_numpy(series: pl.Series) -> Array:
+    """Return the values of a series as an array for matplotlib.
+
+    Integer, float, `Datetime` and `Duration` series without nulls are
+    returned as a view of their buffer. Only a series of several chunks is
+    copied, once, to make it contiguous. Other series are copied: those with
+    nulls into a masked array whose nulls are masked, and filled with NaN or
+    NaT where the dtype allows, so that lines break and points are skipped
+    there. `Decimal` and 128-bit integer series, which NumPy cannot view,
+    are cast to `Float64`. Strings and other dtypes become object arrays.
+    """
+    dtype = series.dtype
+    if dtype.is_numeric() and not viewable(dtype):
+        series = series.cast(pl.Float64)
+    elif not viewable(dtype):
+        return series.to_numpy()
+
+    if series.has_nulls():
+        mask = series.is_null().to_numpy()
+        return np.ma.MaskedArray(series.to_numpy(), mask=mask)
+
+    return series.rechunk().to_numpy(allow_copy=False)
+
+
+def autoscale(ax: Axes) -> None:
+    """Autoscale the view to the data, unless its limits are fixed.
+
+    Facet grids fix the limits of their axes before drawing. Skipping them
+    avoids walking the artists of every shared sibling for each panel.
+    """
+    if ax.get_autoscalex_on() or ax.get_autoscaley_on():
+        ax.autoscale_view()
+
+
+def viewable(dtype: pl.DataType) -> bool:
+    """Return whether NumPy can view a series of the dtype without a copy."""
+    if isinstance(dtype, pl.Int128 | pl.UInt128):
+        return False
+    if dtype.is_integer() or dtype.is_float():
+        return True
+    return isinstance(dtype, pl.Datetime | pl.Duration)
+
 
 class Mark(ABC):
     kwargs: dict[str, Any]
@@ -15,9 +69,72 @@ class Mark(ABC):
     def __init__(self, **kwargs: Any) -> None:
         self.kwargs = kwargs
 
-    def plot(self, ax: Axes, *, x: pl.Series, y: pl.Series, **kwargs: Any) -> None:
+    def exprs(self) -> dict[str, pl.Expr]:
+        """Return extra named expressions to evaluate on the source data."""
+        return {}
+
+    def transform(self, data: pl.LazyFrame, by: list[str]) -> pl.LazyFrame:  # noqa: ARG002  # pyright: ignore[reportUnusedParameter]
+        """Transform the lazy, projected data before it is collected.
+
+        `by` holds the aesthetic and facet columns. The default returns the
+        data unchanged.
+        """
+        return data
+
+    def limits(self) -> tuple[pl.Expr, pl.Expr] | None:
+        """Return the x and y values that the axes must show.
+
+        Facet grids set their axis limits from these without autoscaling.
+        Marks whose artists extend beyond their values, e.g. bars, return
+        None to let matplotlib autoscale.
+        """
+        return pl.col(X), pl.col(Y)
+
+    def draw(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+    ) -> None:
+        """Draw the collected data on the axes.
+
+        `data` holds the code column of each scale. The default
+        implementation calls `plot` once per aesthetic group. Subclasses
+        override this to draw many groups with fewer artists.
+        """
+        gd = GroupedData(data, {name: code(name) for name in scales})
+
+        for df in gd.data:
+            kwargs = {name: s.value(df[code(name)][0]) for name, s in scales.items()}
+            self.plot(ax, x=df[X], y=df[Y], **kwargs)
+
+    def appendable(self) -> bool:
+        """Return whether rows can be added to a drawing with `update`."""
+        return True
+
+    def update(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+        artists: dict[Any, Any],  # noqa: ARG002  # pyright: ignore[reportUnusedParameter]
+    ) -> None:
+        """Draw the data, adding it to what earlier calls drew on the axes.
+
+        `artists` is empty on the first call and kept by the caller between
+        calls, so that marks can keep their artists in it by group and
+        extend them in place. The default draws the data as new artists.
+        """
+        self.draw(ax, data, scales)
+
+    def plot(self, ax: Axes, *, x: pl.Series, y: pl.Series, **kwargs: Any) -> Any:
+        """Draw one group and return the created artists.
+
+        The series are converted with `to_numpy`, so matplotlib receives
+        views of their buffers wherever the dtype allows.
+        """
         kwargs = {self.kwargs_map.get(k, k): v for k, v in kwargs.items()}
-        self._plot(ax, x=x, y=y, **self.kwargs, **kwargs)
+        return self._plot(ax, x=to_numpy(x), y=to_numpy(y), **self.kwargs, **kwargs)
 
     @abstractmethod
-    def _plot(self, ax: Axes, *, x: pl.Series, y: pl.Series, **kwargs: Any) -> None: ...
+    def _plot(self, ax: Axes, *, x: Array, y: Array, **kwargs: Any) -> Any: ...
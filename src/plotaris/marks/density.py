@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, override
+
+import numpy as np
+import polars as pl
+
+from plotaris.core.data import X, Y
+from plotaris.core.scale import code
+
+from .base import Mark
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from matplotlib.axes import Axes
+
+    from plotaris.core.scale import Scale
+
+    from .base import Array
+
+type Agg = Literal["count", "sum", "mean"]
+
+VALUE = "_value"
+GRID = ["_nx", "_ny", "_x0", "_x1", "_y0", "_y1"]
+IMAGE = {"origin": "lower", "aspect": "auto", "interpolation": "nearest"}
+"""The `imshow` arguments of the images, besides the extent."""
+
+
+class DensityMark(Mark):
+    """Bin x and y into a pixel grid and draw it as a single image.
+
+    The binning is part of the lazy query, so only one row per occupied cell
+    and group is collected, however many rows the data has.
+    """
+
+    agg: Agg
+    """The statistic of each cell: the number of rows, or the sum or mean of
+    `value`."""
+    value: str | pl.Expr | None
+    """The values to sum or average when `agg` is `"sum"` or `"mean"`."""
+    bins: tuple[int, int] | None
+    """The number of cells along x and y. Defaults to the size in pixels of a
+    subplot with the figure size and DPI set by `init`."""
+
+    def __init__(
+        self,
+        *,
+        agg: Agg = "count",
+        value: str | pl.Expr | None = None,
+        bins: int | tuple[int, int] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if agg != "count" and value is None:
+            msg = f"Aggregation '{agg}' requires a value"
+            raise ValueError(msg)
+
+        super().__init__(**kwargs)
+        self.agg = agg
+        self.value = value
+        self.bins = (bins, bins) if isinstance(bins, int) else bins
+
+    def resolve_bins(self) -> tuple[int, int]:
+        if self.bins:
+            return self.bins
+
+        from matplotlib import rcParams  # noqa: PLC0415
+
+        width, height = rcParams["figure.figsize"]
+        dpi = rcParams["figure.dpi"]
+        fx = rcParams["figure.subplot.right"] - rcParams["figure.subplot.left"]
+        fy = rcParams["figure.subplot.top"] - rcParams["figure.subplot.bottom"]
+        return max(round(width * dpi * fx), 1), max(round(height * dpi * fy), 1)
+
+    @override
+    def exprs(self) -> dict[str, pl.Expr]:
+        if self.value is None:
+            return {}
+
+        value = pl.col(self.value) if isinstance(self.value, str) else self.value
+        return {VALUE: value}
+
+    @override
+    def transform(self, data: pl.LazyFrame, by: list[str]) -> pl.LazyFrame:
+        """Aggregate the rows per grid cell and group.
+
+        Rows with a null, NaN or infinite x or y are dropped. The cells are
+        binned between the minimum and maximum of x and y, and the extent
+        of the grid is joined to the aggregated cells from a one-row query
+        on the same data, so everything is one lazy query. The result holds
+        the grid size and extent in the `GRID` columns.
+        """
+        x, y = pl.col(X), pl.col(Y)
+        nx, ny = self.resolve_bins()
+        data = data.filter(x.is_finite() & y.is_finite())
+
+        aggs = {"_count": pl.len()}
+        if self.value is not None:
+            aggs["_sum"] = pl.col(VALUE).sum()
+
+        extent = data.select(
+            _nx=pl.lit(nx),
+            _ny=pl.lit(ny),
+            _x0=x.min(),
+            _x1=x.max(),
+            _y0=y.min(),
+            _y1=y.max(),
+        )
+        return (
+            data.group_by([*by, cell(x, nx).alias("_ix"), cell(y, ny).alias("_iy")])
+            .agg(**aggs)
+            .join(extent, how="cross")
+        )
+
+    @override
+    def draw(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+    ) -> None:
+        """Draw the cells as one `imshow`.
+
+        Without a color encoding, the statistic is mapped through the
+        colormap. With one, each cell blends the colors of its categories
+        weighted by their share, and its opacity follows the statistic.
+        """
+        if data.is_empty():
+            return
+
+        from matplotlib.colors import Normalize, to_rgba_array  # noqa: PLC0415
+
+        nx, ny, x0, x1, y0, y1 = data.select(GRID).row(0)
+        cells = (data["_iy"] * nx + data["_ix"]).to_numpy()
+
+        def total(weights: pl.Series) -> np.ndarray[Any, Any]:
+            return np.bincount(cells, weights=weights.to_numpy(), minlength=nx * ny)
+
+        count = total(data["_count"])
+        if self.agg == "count":
+            stat = count
+        else:
+            stat = total(data["_sum"])
+            if self.agg == "mean":
+                stat = np.divide(stat, count, out=np.zeros_like(stat), where=count > 0)
+
+        kwargs: dict[str, Any] = {**IMAGE, "extent": (x0, x1, y0, y1)}
+
+        if (scale := scales.get("color")) is None:
+            image = np.where(count > 0, stat, np.nan).reshape(ny, nx)
+            ax.imshow(image, **kwargs, **self.kwargs)  # pyright: ignore[reportUnknownMemberType]
+            return
+
+        colors = scale.lookup(data[code("color")], to_rgba_array(scale.values))
+        weights = data["_sum" if self.agg == "sum" else "_count"]
+
+        share = total(weights)
+        rgb = [total(weights * colors[:, i]) for i in range(3)]
+        rgb = np.divide(rgb, share, out=np.zeros_like(rgb), where=share != 0)
+
+        if self.agg == "count":
+            alpha = np.log1p(count) / np.log1p(count.max())
+        else:
+            alpha = Normalize()(np.ma.masked_where(count == 0, stat)).filled(0)
+
+        image = np.column_stack([*rgb, np.where(count > 0, alpha, 0)])
+        ax.imshow(image.reshape(ny, nx, 4), **kwargs, **self.kwargs)  # pyright: ignore[reportUnknownMemberType]
+
+    @override
+    def limits(self) -> None:
+        return None
+
+    @override
+    def appendable(self) -> bool:
+        return False
+
+    @override
+    def _plot(self, ax: Axes, *, x: Array, y: Array, **kwargs: Any) -> Any:
+        """Not used, since `draw` draws all groups from the binned cells."""
+        raise NotImplementedError
+
+
+def cell(expr: pl.Expr, n: int) -> pl.Expr:
+    """Return the index of the equal-width bin of `expr` between its extremes."""
+    lo, hi = expr.min(), expr.max()
+    scale = pl.when(hi > lo).then(n / (hi - lo)).otherwise(0)
+    return ((expr - lo) * scale).floor().clip(0, n - 1).cast(pl.Int64)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, override
+
+import polars as pl
+
+from plotaris.core.data import X, Y
+
+from .bar import BarMark
+
+if TYPE_CHECKING:
+    from .bar import Agg, Position
+
+WIDTH = "_binwidth"
+"""The column holding the bin width in the transformed data."""
+
+
+class HistMark(BarMark):
+    """Count the rows per bin of x and draw the counts as bars.
+
+    The bin edges come from the minimum and maximum of x and the counts
+    from one `group_by` of the bin index with the aesthetic and facet
+    columns, all in the lazy query. Only one row per occupied bin and group
+    is collected, so the data may be larger than memory.
+    """
+
+    bins: int
+    """The number of equal-width bins between the minimum and maximum of x."""
+    binwidth: float | None
+    """The width of the bins, starting at the minimum of x. Overrides
+    `bins`."""
+
+    def __init__(
+        self,
+        *,
+        bins: int = 10,
+        binwidth: float | None = None,
+        position: Position = "stack",
+        agg: Agg = "count",
+        **kwargs: Any,
+    ) -> None:
+        if bins < 1 or (binwidth is not None and binwidth <= 0):
+            msg = "Histograms require a positive number of bins and bin width"
+            raise ValueError(msg)
+
+        super().__init__(position=position, agg=agg, **kwargs)
+        self.bins = bins
+        self.binwidth = binwidth
+
+    @override
+    def transform(self, data: pl.LazyFrame, by: list[str]) -> pl.LazyFrame:
+        """Aggregate y with `agg` per bin and group, counting rows by default.
+
+        `X` holds the center of each bin, `Y` the statistic, and `WIDTH`
+        the width of the bins. Values at the maximum fall in the last bin.
+        Rows with a null, NaN or infinite x are dropped.
+        """
+        x = pl.col(X)
+        data = data.filter(x.is_finite())
+        lo, hi = x.min(), x.max()
+
+        if self.binwidth is None:
+            width = pl.when(hi > lo).then((hi - lo) / self.bins).otherwise(1.0)
+        else:
+            width = pl.lit(self.binwidth, pl.Float64)
+        n = ((hi - lo) / width).ceil().clip(lower_bound=1)
+        index = ((x - lo) / width).floor().clip(0, n - 1).cast(pl.Int64)
+        bounds = data.select(lo.alias("_lo"), width.alias(WIDTH))
+
+        return (
+            data.group_by([*by, index.alias("_bin")])
+            .agg(self.statistic(data, self.agg or "count").alias(Y))
+            .join(bounds, how="cross")
+            .select(
+                *by,
+                (pl.col("_lo") + (pl.col("_bin") + 0.5) * pl.col(WIDTH)).alias(X),
+                pl.col(Y),
+                pl.col(WIDTH),
+            )
+            .sort(X, *by)
+        )
+
+    @override
+    def width(self, data: pl.DataFrame) -> float:
+        return data[WIDTH][0]
+
+    @override
+    def appendable(self) -> bool:
+        return False
@@ -1,15 +1,234 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, override
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, override
 
-from plotaris.marks.base import Mark
+import numpy as np
+
+from plotaris.core.data import GroupedData, X, Y
+from plotaris.core.scale import code
+from plotaris.core.transform import decimate_lttb, decimate_minmax
+from plotaris.marks.base import Mark, autoscale, to_numpy
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import polars as pl
     from matplotlib.axes import Axes
+    from matplotlib.lines import Line2D
+
+    from plotaris.core.scale import Scale
+    from plotaris.marks.base import Array
+
+type Decimate = Literal["minmax", "lttb"]
+
+PATH_SIZE = 10_000
+"""The number of points per path of a `LineCollection`. Unlike lines,
+collections are not simplified, and Agg cannot draw much longer paths.
+Data with longer lines on average is drawn with one `plot` per line."""
 
 
 class LineMark(Mark):
+    decimate: Decimate | None
+    """Reduce each line before drawing, to the first, last, minimum and
+    maximum y per horizontal pixel (`"minmax"`) or with
+    Largest-Triangle-Three-Buckets (`"lttb"`). The x values must be sorted within each line."""
+    max_points: int | None
+    """The number of points each line is reduced to, besides the nulls that
+    break it. Defaults to four points per horizontal pixel of the axes for
+    `"minmax"`, and two for `"lttb"`, which follows the figure size and DPI
+    set by `init`."""
+
+    collection_kwargs_map: ClassVar[dict[str, str]] = {
+        "color": "colors",
+        "c": "colors",
+        "linewidth": "linewidths",
+        "lw": "linewidths",
+        "linestyle": "linestyles",
+        "ls": "linestyles",
+        "alpha": "alpha",
+        "zorder": "zorder",
+        "label": "label",
+    }
+    """Line2D keyword arguments that a `LineCollection` also supports."""
+
+    def __init__(
+        self,
+        *,
+        decimate: Decimate | None = None,
+        max_points: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.decimate = decimate
+        self.max_points = max_points
+
+    def reduce(self, ax: Axes, data: pl.DataFrame, by: list[str]) -> pl.DataFrame:
+        """Decimate each line of the data according to `decimate`."""
+        if self.decimate is None:
+            return data
+
+        if not data[X].dtype.is_numeric():
+            msg = "Decimation requires a numeric x encoding"
+            raise ValueError(msg)
+
+        pixels = max(round(ax.bbox.width), 1)
+
+        if self.decimate == "minmax":
+            n_buckets = self.max_points // 4 if self.max_points else pixels
+            return decimate_minmax(data, by, max(n_buckets, 1))
+
+        return decimate_lttb(data, by, self.max_points or 2 * pixels)
+
+    def _batchable(self, data: pl.DataFrame, scales: Mapping[str, Scale[Any]]) -> bool:
+        """Return whether the data can be drawn as a single `LineCollection`."""
+        if not scales.keys() <= {"color"}:
+            return False
+        if not self.kwargs.keys() <= self.collection_kwargs_map.keys():
+            return False
+        if "color" not in scales and not self.kwargs.keys() & {"color", "c"}:
+            return False
+        if len(data) > PATH_SIZE * (len(scales["color"]) if scales else 1):
+            return False
+        return data[X].dtype.is_numeric() and data[Y].dtype.is_numeric()
+
     @override
-    def _plot(self, ax: Axes, *, x: pl.Series, y: pl.Series, **kwargs: Any) -> None:
-        ax.plot(x, y, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+    def draw(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+    ) -> None:
+        """Draw all groups as the segments of one `LineCollection`.
+
+        Falls back to one `plot` call per group if the mark has keyword
+        arguments, encodings or data types that a collection cannot express.
+        Null x or y values become NaN, where the line of their group breaks.
+        """
+        self.update(ax, data, scales, {})
+
+    @override
+    def update(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+        artists: dict[Any, Any],
+    ) -> None:
+        """Draw the data, extending the lines of earlier calls.
+
+        The first call decides whether the lines are drawn as one collection
+        or as one `Line2D` per group, and only it decimates the data. Later
+        calls append the points of a known group to the end of its line,
+        and draw new groups as new lines.
+        """
+        if data.is_empty():
+            return
+
+        if not artists:
+            data = self.reduce(ax, data, [code(name) for name in scales])
+            artists["batched"] = self._batchable(data, scales)
+
+        if artists["batched"]:
+            self._update_collection(ax, data, scales, artists)
+        else:
+            self._update_lines(ax, data, scales, artists)
+
+        autoscale(ax)
+
+    def _update_collection(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+        artists: dict[Any, Any],
+    ) -> None:
+        """Add the data to the paths of the collection.
+
+        `artists` holds the paths, their colors, and the index of the last
+        path of each color code. The points of a known group are added to
+        its last path while it has fewer than `PATH_SIZE` points, and start
+        a new path that overlaps it by one point otherwise, so that only the
+        new points and one path are copied.
+        """
+        paths: list[Array] = artists.setdefault("paths", [])
+        rgba: list[Any] = artists.setdefault("colors", [])
+        last: dict[int, int] = artists.setdefault("last", {})
+        colors = scales.get("color")
+
+        # Split the rows into lines by sorting their codes once
+        keys = data[code("color")].to_numpy() if colors else np.zeros(len(data), int)
+        order = np.argsort(keys, kind="stable")
+        points = np.column_stack([to_numpy(data[X]), to_numpy(data[Y])])[order]
+        unique, starts = np.unique(keys[order], return_index=True)
+        chunks = np.split(points, starts[1:])
+
+        n_paths = len(paths)
+        for key, chunk in zip(unique.tolist(), chunks, strict=True):
+            if (i := last.get(key)) is not None:
+                if len(paths[i]) + len(chunk) <= PATH_SIZE + 1:
+                    paths[i] = np.vstack([paths[i], chunk])
+                    continue
+                chunk = np.vstack([paths[i][-1:], chunk])  # noqa: PLW2901
+
+            new = split(chunk)
+            paths.extend(new)
+            if colors:
+                rgba.extend([colors.value(key)] * len(new))
+            last[key] = len(paths) - 1
+
+        if (collection := artists.get("collection")) is None:
+            from matplotlib.collections import LineCollection  # noqa: PLC0415
+
+            kwargs = {self.collection_kwargs_map[k]: v for k, v in self.kwargs.items()}
+            if colors:
+                kwargs["colors"] = rgba
+            collection = LineCollection(paths, **kwargs)
+            ax.add_collection(collection, autolim=True)
+            artists["collection"] = collection
+            return
+
+        collection.set_segments(paths)
+        if colors and len(paths) > n_paths:
+            collection.set_color(rgba)
+        ax.update_datalim(points)
+
+    def _update_lines(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+        artists: dict[Any, Any],
+    ) -> None:
+        """Add the data to the `Line2D` of each group, or plot new groups.
+
+        `artists` holds the line of each combination of scale codes.
+        """
+        lines: dict[tuple[int, ...], Line2D] = artists.setdefault("lines", {})
+        gd = GroupedData(data, {name: code(name) for name in scales})
+
+        for df in gd.data:
+            key = tuple(df[code(name)][0] for name in scales)
+            if (line := lines.get(key)) is None:
+                kwargs = {
+                    name: s.value(k)
+                    for (name, s), k in zip(scales.items(), key, strict=True)
+                }
+                (lines[key],) = self.plot(ax, x=df[X], y=df[Y], **kwargs)
+                continue
+
+            x, y = to_numpy(df[X]), to_numpy(df[Y])
+            line.set_data(
+                np.ma.concatenate([line.get_xdata(), x]),
+                np.ma.concatenate([line.get_ydata(), y]),
+            )
+            if x.dtype.kind in "iuf" and y.dtype.kind in "iuf":
+                ax.update_datalim(np.column_stack([x, y]))
+
+    @override
+    def _plot(self, ax: Axes, *, x: Array, y: Array, **kwargs: Any) -> Any:
+        return ax.plot(x, y, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+
+
+def split(segment: Array, size: int = PATH_SIZE) -> list[Array]:
+    """Split a line into views of at most `size + 1` points that overlap by one."""
+    return [segment[i : i + size + 1] for i in range(0, max(len(segment) - 1, 1), size)]
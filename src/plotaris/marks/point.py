@@ -2,16 +2,101 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, ClassVar, override
 
-from plotaris.marks.base import Mark
+import numpy as np
+import polars as pl
+
+from plotaris.core.data import X, Y
+from plotaris.core.scale import code
+from plotaris.marks.base import Mark, autoscale, to_numpy
 
 if TYPE_CHECKING:
-    import polars as pl
+    from collections.abc import Mapping
+
     from matplotlib.axes import Axes
+    from matplotlib.collections import PathCollection
+
+    from plotaris.core.scale import Scale
+    from plotaris.marks.base import Array
 
 
 class PointMark(Mark):
     kwargs_map: ClassVar[dict[str, str]] = {"size": "s", "shape": "marker"}
 
     @override
-    def _plot(self, ax: Axes, *, x: pl.Series, y: pl.Series, **kwargs: Any) -> None:
-        ax.scatter(x, y, **kwargs)  # pyright: ignore[reportUnknownMemberType]
+    def draw(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+    ) -> None:
+        """Draw all groups with one `scatter` call per marker shape.
+
+        Colors and sizes are resolved into per-row arrays, since a single
+        collection can vary them but not the marker.
+        """
+        self.update(ax, data, scales, {})
+
+    @override
+    def update(
+        self,
+        ax: Axes,
+        data: pl.DataFrame,
+        scales: Mapping[str, Scale[Any]],
+        artists: dict[Any, Any],
+    ) -> None:
+        """Draw the data, extending the collection of each marker shape.
+
+        The offsets, colors and sizes of a collection from an earlier call
+        are replaced by longer arrays, and a shape seen for the first time
+        gets a new `scatter`. Non-numeric positions are drawn as new
+        collections, since offsets hold numbers only.
+        """
+        if data.is_empty():
+            return
+
+        from matplotlib.colors import to_rgba_array  # noqa: PLC0415
+
+        colors = scales.get("color")
+        rgba = to_rgba_array(colors.values) if colors else None
+        sizes = scales.get("size")
+        shapes = scales.get("shape")
+
+        numeric = data[X].dtype.is_numeric() and data[Y].dtype.is_numeric()
+
+        # Partitioning copies the data, so only split it by marker if needed
+        if shapes:
+            marker = pl.col(code("shape")) % len(shapes.values)
+            parts = data.with_columns(_marker=marker).partition_by("_marker")
+        else:
+            parts = [data]
+
+        for df in parts:
+            kwargs: dict[str, Any] = {}
+            if colors:
+                kwargs["color"] = colors.lookup(df[code("color")], rgba)
+            if sizes:
+                kwargs["size"] = sizes.lookup(df[code("size")])
+            if shapes:
+                kwargs["shape"] = shapes.value(df[code("shape")][0])
+
+            key = df["_marker"][0] if shapes else 0
+            if not numeric or key not in artists:
+                artists[key] = self.plot(ax, x=df[X], y=df[Y], **kwargs)
+                continue
+
+            collection: PathCollection = artists[key]
+            offsets = np.column_stack([to_numpy(df[X]), to_numpy(df[Y])])
+            collection.set_offsets(np.vstack([collection.get_offsets(), offsets]))
+            if colors:
+                fc = collection.get_facecolor()
+                collection.set_facecolor(np.vstack([fc, kwargs["color"]]))  # pyright: ignore[reportArgumentType]
+            if sizes:
+                s = collection.get_sizes()
+                collection.set_sizes(np.concatenate([s, kwargs["size"]]))
+            ax.update_datalim(offsets)
+
+        autoscale(ax)
+
+    @override
+    def _plot(self, ax: Axes, *, x: Array, y: Array, **kwargs: Any) -> Any:
+        return ax.scatter(x, y, **kwargs)  # pyright: ignore[reportUnknownMemberType]
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+
+from plotaris import Chart
+from plotaris.core.categories import to_codes
+from plotaris.core.data import X, Y
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+def labels(ax: Axes, axis: str = "x") -> list[str]:
+    ticks = ax.get_xticklabels() if axis == "x" else ax.get_yticklabels()
+    return [t.get_text() for t in ticks]
+
+
+@pytest.mark.parametrize("dtype", [pl.String, pl.Categorical])
+def test_to_codes(dtype: pl.DataType) -> None:
+    data = pl.DataFrame({X: ["b", "a", None, "b", "c"], Y: [1, 2, 3, 4, 5]})
+    result, categories = to_codes(data.with_columns(pl.col(X).cast(dtype)))
+
+    assert categories == {X: ["b", "a", "c"]}
+    assert result[X].to_list() == [0, 1, None, 0, 2]
+    assert result[Y].to_list() == [1, 2, 3, 4, 5]
+
+
+def test_to_codes_known() -> None:
+    data = pl.DataFrame({Y: ["c", "a", "d"]})
+    result, categories = to_codes(data, {Y: ["a", "b"]})
+
+    assert categories == {Y: ["a", "b", "c", "d"]}
+    assert result[Y].to_list() == [2, 0, 3]
+
+
+def test_display(ax: Axes) -> None:
+    data = pl.DataFrame({"x": ["q", "p", "q"], "y": ["u", "v", "u"], "c": [1, 2, 2]})
+    Chart(data).encode(x="x", y="y", color="c").mark_point().display(ax)
+
+    assert labels(ax) == ["q", "p"]
+    assert labels(ax, "y") == ["u", "v"]
+    offsets = np.asarray(ax.collections[0].get_offsets())
+    assert offsets.tolist() == [[0, 0], [1, 1], [0, 0]]
+
+
+def test_display_facet() -> None:
+    data = pl.DataFrame(
+        {"x": ["b", "a", "a", "c"], "y": [1, 2, 3, 4], "f": [0, 0, 1, 1]},
+    )
+    axes = Chart(data).encode(x="x", y="y").facet(col="f").mark_bar().display()
+    assert isinstance(axes, np.ndarray)
+
+    for ax in axes.flat:
+        assert labels(ax) == ["b", "a", "c"]
+    assert [p.get_x() for p in axes.item(1).patches] == [0.6, 1.6]
+
+
+def test_append(ax: Axes) -> None:
+    chart = Chart(pl.DataFrame({"x": ["a", "b"], "y": [1, 2]})).encode(x="x", y="y")
+    chart.mark_line().display(ax)
+    chart.append(pl.DataFrame({"x": ["c", "a"], "y": [3, 4]}))
+
+    assert labels(ax) == ["a", "b", "c"]
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import matplotlib.pyplot as plt
+import numpy as np
+import polars as pl
+import pytest
+from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+
+from plotaris import Chart, Profile, RenderCache
+from plotaris.core.chart import APPEND_CHUNKS
+from plotaris.marks.line import PATH_SIZE
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [1, 2, 3, 4, 5, 6],
+            "y": [3, 1, 4, 1, 5, 9],
+            "c": ["a", "a", "a", "b", "b", "b"],
+            "f": ["p", "q", "p", "q", "p", "q"],
+            "unused": [0.0] * 6,
+        },
+    )
+
+
+def test_display_requires_mark(data: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="Mark must be defined"):
+        Chart(data).encode(x="x", y="y").display()
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_collect(data: pl.DataFrame, lazy: bool) -> None:
+    source = data.lazy() if lazy else data
+    chart = Chart(source).encode(x="x", y=pl.col("y") * 2, color="c").facet(col="f")
+    result = chart.collect()
+
+    assert result.columns == ["c", "f", "_x", "_y"]
+    assert result["_y"].to_list() == [6, 2, 8, 2, 10, 18]
+
+
+def test_display_lazy(data: pl.DataFrame) -> None:
+    ax = Chart(data.lazy()).encode(x="x", y="y", color="c").mark_line().display()
+    assert isinstance(ax, Axes)
+    assert len(ax.get_lines()) == 0
+    assert len(ax.collections) == 1
+
+
+def test_display_lazy_facet(data: pl.DataFrame) -> None:
+    chart = Chart(data.lazy()).encode(x="x", y="y").facet(col="f").mark_point()
+    axes = chart.display(engine="streaming")
+    assert isinstance(axes, np.ndarray)
+    assert axes.shape == (1, 2)
+
+
+@pytest.mark.parametrize(
+    ("scope", "expected"),
+    [("data", [None, 2, 2.5, 2.5, 3, 7]), ("group", [None, 2, 2.5, None, 3, 7])],
+)
+def test_collect_scope(data: pl.DataFrame, scope: str, expected: list[float]) -> None:
+    y = pl.col("y").rolling_mean(2)
+    chart = Chart(data).encode(x="x", y=y, color="c", scope=scope)  # pyright: ignore[reportArgumentType]
+
+    assert chart.collect()["_y"].to_list() == expected
+
+
+def test_collect_scope_facet(data: pl.DataFrame) -> None:
+    y = pl.col("y").cum_sum()
+    chart = Chart(data).encode(x="x", y=y, scope="group").facet(col="f")
+
+    assert chart.collect()["_y"].to_list() == [3, 1, 7, 2, 12, 11]
+
+
+def test_append_line(data: pl.DataFrame) -> None:
+    chart = Chart(data.head(4)).encode(x="x", y="y", color="c").mark_line()
+    ax = chart.display()
+    assert isinstance(ax, Axes)
+    collection = ax.collections[0]
+
+    chart.append(data.tail(2))
+    rows = data.head(2).with_columns(
+        x=pl.Series([7, 8]),
+        y=pl.Series([0, 0]),
+        c=pl.lit("z"),
+    )
+    chart.append(rows)
+
+    assert list(ax.collections) == [collection]
+    assert isinstance(collection, LineCollection)
+    segments = [s[:, 1].tolist() for s in collection.get_segments()]
+    assert segments == [[3, 1, 4], [1, 5, 9], [0, 0]]
+    assert len(collection.get_colors()) == 3
+    assert ax.get_xlim()[1] >= 8
+    assert isinstance(chart.data, pl.DataFrame)
+    assert len(chart.data) == 8
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"marker": "o"}])
+def test_append_line2d(kwargs: dict[str, str]) -> None:
+    data = pl.DataFrame({"x": [1, 3, 5, 7], "y": [2, 4, 6, 8], "c": ["a"] * 4})
+    chart = Chart(data.head(1)).encode(x="x", y="y").mark_line(**kwargs)
+    ax = chart.display()
+    assert isinstance(ax, Axes)
+
+    for i in range(1, 4):
+        chart.append(data[i : i + 1])
+
+    (line,) = ax.get_lines()
+    assert np.asarray(line.get_xdata()).tolist() == [1, 3, 5, 7]
+    assert np.asarray(line.get_ydata()).tolist() == [2, 4, 6, 8]
+    assert ax.get_xlim()[1] >= 7
+
+
+def test_append_line_tail() -> None:
+    n = PATH_SIZE
+    data = pl.DataFrame({"x": range(n + 2), "y": range(n + 2), "c": 0})
+    chart = Chart(data.head(n)).encode(x="x", y="y", color="c").mark_line()
+    ax = chart.display()
+    assert isinstance(ax, Axes)
+    chart.append(data.tail(2))
+
+    collection = ax.collections[0]
+    assert isinstance(collection, LineCollection)
+    segments = collection.get_segments()
+    assert [len(s) for s in segments] == [n, 3]
+    assert segments[1][:, 0].tolist() == [n - 1, n, n + 1]
+    assert len(collection.get_colors()) == 2
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_append_bounded(lazy: bool) -> None:
+    data = pl.DataFrame({"x": range(200), "y": range(200)})
+    source = data.head(1).lazy() if lazy else data.head(1)
+    chart = Chart(source).encode(x="x", y="y").mark_point()
+    chart.display()
+
+    for i in range(1, 200):
+        chart.append(data[i : i + 1])
+
+    if isinstance(chart.data, pl.LazyFrame):
+        assert chart.data.explain(optimized=False).count("END UNION") == 1
+        assert chart.data.collect().equals(data)
+    else:
+        assert chart.data.n_chunks() <= APPEND_CHUNKS + 1
+        assert chart.data.equals(data)
+
+
+def test_append_point(data: pl.DataFrame) -> None:
+    chart = Chart(data.head(3)).encode(x="x", y="y", color="c", shape="f")
+    ax = chart.mark_point().display()
+    assert isinstance(ax, Axes)
+    chart.append(data.tail(3))
+
+    assert len(ax.collections) == 2
+    offsets = [np.asarray(c.get_offsets())[:, 0].tolist() for c in ax.collections]
+    assert offsets == [[1, 3, 5], [2, 4, 6]]
+    colors = np.asarray(ax.collections[0].get_facecolor())
+    assert colors[0].tolist() != colors[2].tolist()
+
+
+def test_append_errors(data: pl.DataFrame) -> None:
+    chart = Chart(data).encode(x="x", y="y").mark_bar(position="stack")
+    with pytest.raises(ValueError, match="must be displayed"):
+        chart.append(data)
+
+    chart.display()
+    with pytest.raises(ValueError, match="BarMark does not support"):
+        chart.append(data)
+
+    chart = Chart(data).encode(x="x", y=pl.col("y").sum()).mark_line()
+    chart.display()
+    with pytest.raises(ValueError, match="Aggregated encodings"):
+        chart.append(data)
+
+
+def test_from_batches(data: pl.DataFrame) -> None:
+    batches = data.iter_slices(2)
+    chart = Chart.from_batches(batches).encode(x="x", y="y", color="c").mark_line()
+    ax = chart.display()
+    assert isinstance(ax, Axes)
+
+    collection = ax.collections[0]
+    assert isinstance(collection, LineCollection)
+    segments = [s[:, 1].tolist() for s in collection.get_segments()]
+    assert segments == [[3, 1, 4], [1, 5, 9]]
+    assert isinstance(chart.data, pl.DataFrame)
+    assert chart.data.is_empty()
+
+    with pytest.raises(ValueError, match="No batches to display"):
+        chart.display()
+
+
+def test_from_batches_line2d(data: pl.DataFrame) -> None:
+    chart = Chart.from_batches(data.iter_slices(2)).encode(x="x", y="y")
+    ax = chart.mark_line().display()
+    assert isinstance(ax, Axes)
+
+    (line,) = ax.get_lines()
+    assert np.asarray(line.get_ydata()).tolist() == data["y"].to_list()
+
+
+def test_from_batches_cache(data: pl.DataFrame, tmp_path: Path) -> None:
+    chart = Chart.from_batches(data.iter_slices(2)).encode(x="x", y="y")
+    with pytest.raises(ValueError, match="cannot be cached"):
+        chart.mark_line().render(cache=RenderCache(tmp_path))
+
+
+def test_from_batches_errors(data: pl.DataFrame) -> None:
+    chart = Chart.from_batches(data.iter_slices(2)).encode(x="x", y="y")
+    with pytest.raises(ValueError, match="cannot be collected"):
+        chart.collect()
+
+    plt.close("all")
+    chart = chart.facet(col="f").mark_line()
+    with pytest.raises(ValueError, match="cannot be faceted"):
+        chart.render()
+    assert plt.get_fignums() == []
+
+
+def test_from_batches_point(data: pl.DataFrame) -> None:
+    batches = (data[i : i + 1] for i in range(len(data)))
+    chart = Chart.from_batches(batches).encode(x="x", y="y", color="f")
+    ax = chart.mark_point().display()
+    assert isinstance(ax, Axes)
+
+    assert len(ax.collections) == 1
+    colors = np.asarray(ax.collections[0].get_facecolor())
+    assert len(colors) == 6
+    assert colors[0].tolist() == colors[2].tolist() != colors[1].tolist()
+
+
+def test_display_profile(data: pl.DataFrame) -> None:
+    chart = Chart(data).encode(x="x", y="y", color="c").mark_point()
+    assert chart.profile is None
+
+    profiles: list[Profile] = []
+    chart.display(profile=profiles.append)
+    assert profiles == [chart.profile]
+
+    stages = {s.name: s for s in profiles[0].stages}
+    assert list(stages) == ["collect", "scales", "draw"]
+    assert stages["collect"].rows == 6
+    assert stages["scales"].groups == 2
+    assert stages["draw"].artists == 1
+    assert profiles[0].seconds == sum(s.seconds for s in stages.values())
+
+
+def test_display_profile_facet(data: pl.DataFrame) -> None:
+    chart = Chart(data).encode(x="x", y="y").facet(col="f").mark_line()
+    chart.display(profile=True)
+    assert chart.profile
+
+    stages = {s.name: s for s in chart.profile.stages}
+    assert list(stages)[:4] == ["collect", "scales", "group_by", "subplots"]
+    assert stages["group_by"].groups == 2
+    assert stages["draw"].artists == 2
+    assert "tight_layout" in str(chart.profile)
+
+
+def test_render_profile(data: pl.DataFrame) -> None:
+    chart = Chart(data).encode(x="x", y="y").mark_bar()
+    chart.render(profile=True)
+    assert chart.profile
+    assert chart.profile.stages[-1].name == "savefig"
+
+
+def test_render_threads(data: pl.DataFrame) -> None:
+    def render(i: int) -> bytes:
+        chart = Chart(data).encode(x="x", y="y", color="c").mark_line()
+        if i % 2:
+            chart.facet(col="f")
+        return chart.render(dpi=50 + i)
+
+    with ThreadPoolExecutor(4) as executor:
+        images = list(executor.map(render, range(8)))
+
+    assert all(image.startswith(b"\x89PNG") for image in images)
+    assert len(set(images)) == len(images)
+    assert not plt.get_fignums()
+
+
+def test_save(data: pl.DataFrame, tmp_path: Path) -> None:
+    chart = Chart(data).encode(x="x", y="y").mark_point()
+    chart.save(tmp_path / "chart.svg")
+    chart.save(tmp_path / "chart", format="pdf")
+
+    assert b"<svg" in (tmp_path / "chart.svg").read_bytes()
+    assert (tmp_path / "chart").read_bytes().startswith(b"%PDF")
+    assert not plt.get_fignums()
@@ -4,7 +4,8 @@ import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from plotaris.core.data import GroupedData, group_by
+from plotaris.core.data import GroupedData, X, Y, group_by, select
+from plotaris.core.encoding import Encoding
 
 
 @pytest.fixture(scope="module")
@@ -126,7 +127,62 @@ def test_data_empty() -> None:
     assert len(result) == 0
 
 
+def test_group_by_dtypes() -> None:
+    data = pl.DataFrame(
+        {
+            "c": pl.Series(["q", "p", "q"], dtype=pl.Categorical),
+            "t": pl.Series([0, 0, 1]).cast(pl.Datetime("ms", "UTC")),
+            "v": [1, 2, 3],
+        },
+    )
+    group, dfs = group_by(data, "c", "t")
+
+    assert group.schema == data.select("c", "t").schema
+    assert group.rows() == data.select("c", "t").rows()
+    assert [df["v"].to_list() for df in dfs] == [[1], [2], [3]]
+
+
 def test_group_by_no_data() -> None:
     group, dfs = group_by(pl.DataFrame({"x": []}), "x")
     assert_frame_equal(group, pl.DataFrame({"x": []}))
     assert len(dfs) == 0
+
+
+def test_select_projects_encoded_columns(data: pl.DataFrame) -> None:
+    data = data.with_columns(z=pl.lit("unused"))
+    encoding = Encoding(x="x", y=pl.col("x") * 2, color=["a"])
+    result = select(data.lazy(), encoding, ["b"]).collect()
+
+    assert result.columns == ["a", "b", X, Y]
+    assert result[Y].to_list() == [0, 2, 4, 6, 8, 10]
+
+
+def test_select_lazy(data: pl.DataFrame) -> None:
+    result = select(data.lazy(), Encoding(x="x"))
+
+    assert isinstance(result, pl.LazyFrame)
+    assert result.collect_schema().names() == [X]
+
+
+def test_select_aggregate(data: pl.DataFrame) -> None:
+    encoding = Encoding(x="b", y=pl.col("x").mean(), color=["a"])
+    result = select(data, encoding).collect()
+
+    assert result.columns == ["a", X, Y]
+    assert result.rows() == [(1, 3, 0.5), (1, 4, 2.0), (2, 4, 3.0), (2, 5, 4.5)]
+
+
+def test_select_aggregate_without_x(data: pl.DataFrame) -> None:
+    result = select(data, Encoding(y=pl.len())).collect()
+    assert result.rows() == [(6,)]
+
+
+def test_index_first_appearance() -> None:
+    data = pl.DataFrame({"a": [3, 1, 3, 2, 1], "b": [0, 0, 1, 1, 0]})
+    result = GroupedData(data, {"color": "a", "shape": "b"})
+
+    expected = pl.DataFrame({"color": [0, 1, 0, 2], "shape": [0, 0, 1, 1]})
+
+    assert_frame_equal(result.group, expected, check_dtypes=False)
+    assert [len(df) for df in result.data] == [1, 2, 1, 1]
+    assert result.item(1, "color") == (1,)
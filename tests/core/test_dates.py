@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+from matplotlib.dates import AutoDateLocator, ConciseDateFormatter
+
+from plotaris import Chart
+from plotaris.core.data import X, Y
+from plotaris.core.dates import to_dates
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+TIMES = [
+    datetime(2025, 1, 1, 12, tzinfo=UTC),
+    datetime(2025, 3, 1, 0, 0, 1, tzinfo=UTC),
+]
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def days(value: date) -> float:
+    """Return a date or datetime as days since matplotlib's default epoch."""
+    if isinstance(value, datetime):
+        return (value - EPOCH).total_seconds() / 86_400
+    return (value - EPOCH.date()).days
+
+
+@pytest.mark.parametrize("unit", ["ms", "us", "ns"])
+@pytest.mark.parametrize("tz", [None, "UTC", "Asia/Tokyo"])
+def test_to_dates_datetime(unit: str, tz: str | None) -> None:
+    dtype = pl.Datetime(unit, "UTC")  # pyright: ignore[reportArgumentType]
+    times = pl.Series(X, TIMES, dtype=dtype).dt.convert_time_zone(tz or "UTC")
+    if tz is None:
+        times = times.dt.replace_time_zone(None)
+
+    data, zones = to_dates(pl.LazyFrame([times]))
+
+    assert zones == {X: tz}
+    result = data.collect()[X].to_list()
+    assert result == pytest.approx([days(t) for t in TIMES], abs=1e-9)
+
+
+def test_to_dates_date() -> None:
+    dates = [date(1969, 12, 31), date(2025, 6, 30)]
+    data, zones = to_dates(pl.LazyFrame({X: [1, 2], Y: dates}))
+
+    assert zones == {Y: None}
+    assert data.collect()[Y].to_list() == [-1, days(dates[1])]
+    assert data.collect()[X].to_list() == [1, 2]
+
+
+def test_display(ax: Axes) -> None:
+    times = pl.Series(TIMES).dt.convert_time_zone("Asia/Tokyo")
+    data = pl.DataFrame({"t": times, "y": [1, 2]})
+    Chart(data).encode(x="t", y="y").mark_line(color="k").display(ax)
+
+    locator = ax.xaxis.get_major_locator()
+    assert isinstance(locator, AutoDateLocator)
+    assert locator.tz.utcoffset(datetime(2025, 1, 1)) == timedelta(hours=9)  # noqa: DTZ001
+    assert isinstance(ax.xaxis.get_major_formatter(), ConciseDateFormatter)
+    assert not isinstance(ax.yaxis.get_major_formatter(), ConciseDateFormatter)
+
+
+def test_display_facet() -> None:
+    data = pl.DataFrame({"t": TIMES * 2, "y": range(4), "f": [0, 0, 1, 1]})
+    axes = Chart(data).encode(x="t", y="y").facet(col="f").mark_point().display()
+    assert isinstance(axes, np.ndarray)
+
+    for ax in axes.flat:
+        assert isinstance(ax.xaxis.get_major_formatter(), ConciseDateFormatter)
+
+
+def test_hist() -> None:
+    data = pl.DataFrame(
+        {"d": pl.date_range(date(2025, 1, 1), date(2025, 1, 10), eager=True)},
+    )
+    result = Chart(data).encode(x="d").mark_hist(bins=3).collect()
+
+    assert result[Y].to_list() == [3, 3, 4]
+    assert result[X][0] == days(date(2025, 1, 2)) + 0.5
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import polars as pl
+
+from plotaris.colors import COLORS
+from plotaris.core.encoding import Encoding
+
+
+def test_create_scales() -> None:
+    data = pl.DataFrame({"a": [2, 1, 2], "b": ["x", "y", "z"]})
+    encoding = Encoding(color=["a"], shape=["a", "b"])
+    scales = encoding.create_scales(data)
+
+    assert list(scales) == ["color", "shape"]
+    assert scales["color"].domain["a"].to_list() == [2, 1]
+    assert scales["color"].values == COLORS
+    assert len(scales["shape"]) == 3
+
+
+def test_columns() -> None:
+    encoding = Encoding(x="x", color=["b", "a"], size=["a"])
+    assert encoding.columns() == ["a", "b"]
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, time, timedelta
+from typing import Any
+
+import polars as pl
+import pytest
+
+from plotaris import Chart
+from plotaris.core.grid import FacetGrid, FacetSpec, expand
+from plotaris.marks.bar import BarMark
+from plotaris.marks.point import PointMark
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame({"x": range(7), "y": range(7), "f": list("abcdefg")})
+
+
+def grid(data: pl.DataFrame, spec: FacetSpec) -> FacetGrid:
+    chart = Chart(data).encode(x="x", y="y")
+    chart.facet_spec = spec
+    return FacetGrid(chart.collect(), chart.encoding, spec)
+
+
+def test_cells(data: pl.DataFrame) -> None:
+    g = grid(data, FacetSpec(col=["f"]))
+    assert g.axes.shape == (1, 7)
+    assert g.cells == [(0, j) for j in range(7)]
+
+
+def test_wrap_col(data: pl.DataFrame) -> None:
+    g = grid(data, FacetSpec(col=["f"], wrap=3))
+    assert g.axes.shape == (3, 3)
+    assert g.cells[3:5] == [(1, 0), (1, 1)]
+
+
+def test_wrap_row(data: pl.DataFrame) -> None:
+    g = grid(data, FacetSpec(row=["f"], wrap=3))
+    assert g.axes.shape == (3, 3)
+    assert g.cells[3:5] == [(0, 1), (1, 1)]
+
+
+def test_wrap_both(data: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="either row or col"):
+        grid(data, FacetSpec(row=["f"], col=["f"], wrap=3))
+
+
+def test_wrap_sparse(data: pl.DataFrame) -> None:
+    g = grid(data, FacetSpec(col=["f"], wrap=3))
+    g.plot(PointMark())
+    axes = g.axes
+
+    assert axes[2, 0] is not None
+    assert axes[2, 1] is None
+    assert axes[2, 2] is None
+    assert len(g.fig.axes) == 7
+    assert axes[1, 1].xaxis.get_tick_params()["labelbottom"]
+    assert not axes[0, 0].xaxis.get_tick_params()["labelbottom"]
+    assert axes[2, 0].get_title() == "f=g"
+
+
+def test_sparse() -> None:
+    data = pl.DataFrame({"x": [1, 2, 3], "r": [0, 1, 1], "c": ["a", None, "b"]})
+    data = data.with_columns(y="x")
+    g = grid(data, FacetSpec(row=["r"], col=["c"], sparse=True))
+    g.plot(PointMark())
+
+    assert g.axes.shape == (2, 3)
+    assert [ax is not None for ax in g.axes.flat] == [1, 0, 0, 0, 1, 1]
+    assert g.axes[0, 0].get_shared_x_axes().joined(g.axes[0, 0], g.axes[1, 2])
+    assert g.axes[0, 0].xaxis.get_tick_params()["labelbottom"]
+    assert not g.axes[1, 2].yaxis.get_tick_params()["labelleft"]
+    assert g.titles() == ["r=0 | c=a", "r=1 | c=None", "r=1 | c=b"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [True, False, None],
+        [datetime(2024, 1, 1), datetime(2024, 1, 1, 0, 0, 0, 500)],  # noqa: DTZ001
+        [datetime(2024, 1, 1, tzinfo=UTC)],
+        [date(2024, 1, 1)],
+        [time(1, 2, 3), time(1, 2, 3, 4)],
+        [
+            timedelta(0),
+            timedelta(days=1),
+            timedelta(days=-2, seconds=5, microseconds=7),
+        ],
+        [timedelta(days=3, seconds=3725)],
+        [1.5, 1e16],
+    ],
+)
+def test_titles(values: list[Any]) -> None:
+    data = pl.DataFrame({"v": values}).with_columns(x=pl.lit(1), y=pl.lit(1))
+    g = grid(data, FacetSpec(col=["v"]))
+
+    assert sorted(g.titles()) == sorted(f"v={v}" for v in values)
+
+
+@pytest.fixture(scope="module")
+def panels() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [0, 1, 10, 12, 0, 2, 20, 30],
+            "y": [0, 1, 5, 6, 100, 101, 50, 60],
+            "r": [0, 0, 0, 0, 1, 1, 1, 1],
+            "c": [0, 0, 1, 1, 0, 0, 1, 1],
+        },
+    )
+
+
+def limits(g: FacetGrid) -> list[tuple[tuple[float, ...], tuple[float, ...]]]:
+    return [(ax.get_xlim(), ax.get_ylim()) for ax in g.fig.axes]
+
+
+def test_limits_fixed(panels: pl.DataFrame) -> None:
+    g = grid(panels, FacetSpec(row=["r"], col=["c"]))
+    g.plot(PointMark())
+
+    assert len(set(limits(g))) == 1
+    assert not g.axes[0, 0].get_autoscalex_on()
+    x0, x1 = g.axes[0, 0].get_xlim()
+    assert x0 < 0 < 30 < x1
+
+
+def test_limits_free_x(panels: pl.DataFrame) -> None:
+    g = grid(panels, FacetSpec(row=["r"], col=["c"], scales="free_x"))
+    g.plot(PointMark())
+    (a, b), (c, d) = g.axes
+
+    assert a.get_xlim() == c.get_xlim() != b.get_xlim() == d.get_xlim()
+    assert len({ax.get_ylim() for ax in g.axes.flat}) == 1
+    assert a.get_xlim()[1] < 5 < b.get_xlim()[0]
+
+
+def test_limits_wrap_free(panels: pl.DataFrame) -> None:
+    g = grid(panels, FacetSpec(col=["r", "c"], wrap=3, scales="free"))
+    g.plot(PointMark())
+
+    assert len(g.fig.axes) == 4
+    assert len(set(limits(g))) == 4
+
+
+def test_limits_non_finite(panels: pl.DataFrame) -> None:
+    y = [float("inf"), float("-inf"), float("nan"), None]
+    extra = pl.DataFrame({"x": [5] * 4, "y": y, "r": [0] * 4, "c": [0] * 4})
+    g = grid(pl.concat([panels, extra], how="vertical_relaxed"), FacetSpec(col=["c"]))
+    g.plot(PointMark())
+
+    y0, y1 = g.axes[0, 0].get_ylim()
+    assert y0 < 0 < 101 < y1 < 200
+
+
+def test_limits_bar(panels: pl.DataFrame) -> None:
+    g = grid(panels, FacetSpec(col=["c"]))
+    g.plot(BarMark())
+
+    assert g.axes[0, 0].get_autoscaley_on()
+
+
+def test_expand() -> None:
+    assert expand(1, 2) == (1, 2)
+    assert expand(0, 0) == (-0.05, 0.05)
+    assert expand(-2, -2) == (-2.1, -1.9)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from plotaris.core.layout import TIGHT_LAYOUT_MAX_PANELS, Layout
+
+
+def test_create() -> None:
+    one = Layout.create(1, 1)
+    grid = Layout.create(3, 4)
+
+    assert grid.figsize[0] > 3.5 * one.figsize[0]
+    assert grid.figsize[1] > 2.5 * one.figsize[1]
+    assert 0 < grid.left < grid.right < 1
+    assert 0 < grid.bottom < grid.top < 1
+
+
+@pytest.mark.parametrize(("nrows", "tight"), [(1, True), (20, False)])
+def test_tight(nrows: int, tight: bool) -> None:
+    assert Layout.create(nrows, TIGHT_LAYOUT_MAX_PANELS).tight is tight
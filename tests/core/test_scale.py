@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from plotaris.core.scale import CODE, Scale, code, with_codes
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame({"a": ["p", "q", "p", None, "r"], "b": [1, 1, 1, 2, 2]})
+
+
+def test_from_data(data: pl.DataFrame) -> None:
+    scale = Scale[str].from_data(data, ["a"], ["red", "blue"])
+
+    assert len(scale) == 4
+    assert scale.domain["a"].to_list() == ["p", "q", None, "r"]
+    assert scale.domain[CODE].to_list() == [0, 1, 2, 3]
+    assert [scale.value(i) for i in range(4)] == ["red", "blue", "red", "blue"]
+
+
+def test_encode(data: pl.DataFrame) -> None:
+    scale = Scale[int].from_data(data, ["a", "b"], [10, 20, 30])
+    codes = scale.encode(data)
+
+    assert codes.to_list() == [0, 1, 0, 2, 3]
+    assert scale.lookup(codes).tolist() == [10, 20, 10, 30, 10]
+
+
+def test_with_codes(data: pl.DataFrame) -> None:
+    scales = {"color": Scale[str].from_data(data, ["b"], ["red"])}
+    result = with_codes(data.tail(2), scales)
+
+    assert result[code("color")].to_list() == [1, 1]
+
+
+def test_extend(data: pl.DataFrame) -> None:
+    scale = Scale[str].from_data(data.head(2), ["a"], ["red", "blue"])
+    extended = scale.extend(data)
+
+    assert extended.domain["a"].to_list() == ["p", "q", None, "r"]
+    assert extended.encode(data).to_list() == [0, 1, 0, 2, 3]
+    assert extended.extend(data) is extended
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from plotaris.core.data import X, Y
+from plotaris.core.transform import decimate_lttb, decimate_minmax
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 10_000
+    return pl.DataFrame(
+        {
+            "g": np.repeat([1, 0], n // 2),
+            X: np.tile(np.arange(n // 2, dtype=float), 2),
+            Y: rng.standard_normal(n).cumsum(),
+        },
+    )
+
+
+def extent(data: pl.DataFrame) -> pl.DataFrame:
+    return data.group_by("g", maintain_order=True).agg(
+        lo=pl.col(Y).min(),
+        hi=pl.col(Y).max(),
+        first=pl.col(X).first(),
+        last=pl.col(X).last(),
+    )
+
+
+def test_decimate_minmax(data: pl.DataFrame) -> None:
+    result = decimate_minmax(data, ["g"], 100)
+
+    assert all(200 <= n <= 400 for n in result["g"].value_counts()["count"])
+    assert extent(result).equals(extent(data))
+    assert result.group_by("g").agg(pl.col(X).is_sorted())[X].all()
+
+
+def test_decimate_minmax_edges() -> None:
+    y = [1.0, 0, 5, 2, 3, 4, 7, 9, 8, 6, 8, 8]
+    data = pl.DataFrame({X: range(12), Y: y})
+
+    assert decimate_minmax(data, [], 2)[X].to_list() == [0, 1, 2, 5, 6, 7, 9, 11]
+
+
+def test_decimate_minmax_nulls() -> None:
+    y = [1.0, 0, 5, None, None, 4, 7, 9, 8, 6, 8, 8]
+    result = decimate_minmax(pl.DataFrame({X: range(12), Y: y}), [], 2)
+
+    assert result[X].to_list() == [0, 1, 2, 3, 5, 6, 7, 9, 11]
+    assert result[Y].is_null().arg_true().to_list() == [3]
+
+
+def test_decimate_minmax_small() -> None:
+    data = pl.DataFrame({X: [1.0, 2.0, 3.0], Y: [3.0, 1.0, 2.0]})
+    assert decimate_minmax(data, [], 2).equals(data)
+
+
+def test_decimate_lttb(data: pl.DataFrame) -> None:
+    result = decimate_lttb(data, ["g"], 100)
+
+    assert result["g"].value_counts()["count"].to_list() == [100, 100]
+    assert extent(result)[["first", "last"]].equals(extent(data)[["first", "last"]])
+
+
+def test_decimate_lttb_peak() -> None:
+    data = pl.DataFrame({X: [1.0, 2, 3, 4, 5, 6], Y: [0.0, 5, 1, 1, -3, 0]})
+
+    assert decimate_lttb(data, [], 3)[X].to_list() == [1, 2, 6]
+    assert decimate_lttb(data, [], 4)[X].to_list() == [1, 2, 5, 6]
+    assert decimate_lttb(data, [], 10).equals(data)
+
+
+def test_decimate_lttb_nulls() -> None:
+    y = [0.0, 5, 1, 2, None, None, 1, -3, 2, 0]
+    result = decimate_lttb(pl.DataFrame({X: range(10), Y: y}), [], 4)
+
+    assert result[X].to_list() == [0, 1, 3, 4, 6, 7, 9]
+    assert result[Y].is_null().arg_true().to_list() == [3]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from matplotlib.patches import Rectangle
+
+from plotaris import Chart
+from plotaris.marks.bar import BarMark
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+    from plotaris.marks.bar import Agg, Position
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [1, 2, 1, 2, 1],
+            "y": [1, 2, 3, 4, 5],
+            "c": ["a", "a", "b", "b", "c"],
+        },
+    )
+
+
+def bars(ax: Axes) -> list[tuple[float, float, float, float]]:
+    return [
+        (round(p.get_x(), 3), round(p.get_width(), 3), p.get_y(), p.get_height())
+        for p in ax.patches
+        if isinstance(p, Rectangle)
+    ]
+
+
+def test_identity(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y", color="c").mark_bar().display(ax)
+
+    assert len(ax.containers) == 1
+    assert [b[2:] for b in bars(ax)] == [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5)]
+
+
+def test_stack(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y", color="c").mark_bar(position="stack").display(ax)
+
+    assert [b[2:] for b in bars(ax)] == [(0, 1), (0, 2), (1, 3), (2, 4), (4, 5)]
+
+
+def test_dodge(data: pl.DataFrame, ax: Axes) -> None:
+    chart = Chart(data).encode(x="x", y="y", color="c")
+    chart.mark_bar(position="dodge", width=0.6).display(ax)
+
+    assert [b[:2] for b in bars(ax)] == [
+        (0.7, 0.2),
+        (1.7, 0.2),
+        (0.9, 0.2),
+        (1.9, 0.2),
+        (1.1, 0.2),
+    ]
+
+
+def test_dodge_categorical(ax: Axes) -> None:
+    data = pl.DataFrame({"x": ["q", "p", "q"], "y": [1, 2, 3], "c": ["a", "a", "b"]})
+    chart = Chart(data).encode(x="x", y="y", color="c")
+    chart.mark_bar(position="dodge", width=0.6).display(ax)
+
+    assert [b[:2] for b in bars(ax)] == [(-0.3, 0.3), (0.7, 0.3), (0.0, 0.3)]
+
+
+def test_dodge_requires_numeric_x(ax: Axes) -> None:
+    data = pl.DataFrame({"x": [True, False], "y": [1, 2], "c": ["a", "b"]})
+    chart = Chart(data).encode(x="x", y="y", color="c").mark_bar(position="dodge")
+
+    with pytest.raises(ValueError, match="numeric x"):
+        chart.display(ax)
+
+
+@pytest.mark.parametrize("position", ["stack", "dodge"])
+def test_position_requires_color(
+    data: pl.DataFrame,
+    position: Position,
+    ax: Axes,
+) -> None:
+    chart = Chart(data).encode(x="x", y="y", size="c").mark_bar(position=position)
+
+    with pytest.raises(ValueError, match=f"position '{position}' support only color"):
+        chart.display(ax)
+
+
+@pytest.mark.parametrize(
+    ("agg", "color", "heights"),
+    [
+        ("sum", ["c"], [1, 2, 3, 4, 5]),
+        ("count", ["c"], [1, 1, 1, 1, 1]),
+        ("mean", [], [3, 3]),
+        ("max", [], [5, 4]),
+    ],
+)
+def test_agg(
+    data: pl.DataFrame,
+    ax: Axes,
+    agg: Agg,
+    color: list[str],
+    heights: list[float],
+) -> None:
+    chart = Chart(data).encode(x="x", y="y", color=color).mark_bar(agg=agg)
+    assert len(chart.collect()) == len(heights)
+
+    chart.display(ax)
+    assert [b[3] for b in bars(ax)] == heights
+
+
+def test_agg_stack(ax: Axes) -> None:
+    data = pl.DataFrame({"x": ["p", "q"] * 4, "y": range(8), "c": list("aabb") * 2})
+    chart = Chart(data).encode(x="x", y="y", color="c")
+    chart.mark_bar(agg="sum", position="stack").display(ax)
+
+    assert [b[2:] for b in bars(ax)] == [(0, 4), (0, 6), (4, 8), (6, 10)]
+
+
+def test_agg_encoding(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y=pl.col("y").max()).mark_bar().display(ax)
+    assert [b[3] for b in bars(ax)] == [5, 4]
+
+
+def test_agg_requires_y(data: pl.DataFrame) -> None:
+    chart = Chart(data).encode(x="x").mark_bar(agg="mean")
+    with pytest.raises(ValueError, match="requires a y encoding"):
+        chart.collect()
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("position", ["identity", "stack"])
+def test_nulls(position: Position, ax: Axes) -> None:
+    data = pl.DataFrame({"x": [1, 2, 3], "y": [1.0, None, 3.0]})
+    Chart(data).encode(x="x", y="y").mark_bar(position=position).display(ax)
+
+    heights = [p.get_height() for p in ax.patches if isinstance(p, Rectangle)]
+    assert heights[0::2] == [1, 3]
+
+
+@pytest.mark.filterwarnings("error")
+def test_plot_nulls(ax: Axes) -> None:
+    BarMark().plot(ax, x=pl.Series([1, 2]), y=pl.Series([None, 2.0]))
+
+    heights = [p.get_height() for p in ax.patches if isinstance(p, Rectangle)]
+    assert heights[1] == 2
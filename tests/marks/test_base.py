@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import polars as pl
+import pytest
+
+from plotaris import Chart
+from plotaris.marks.base import autoscale, to_numpy
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from pytest_mock import MockerFixture
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pl.Series([1.0, 2.0]),
+        pl.Series([1, 2], dtype=pl.Int32),
+        pl.Series([datetime(2025, 1, 1, tzinfo=UTC)]),
+    ],
+)
+def test_to_numpy_view(series: pl.Series) -> None:
+    array = to_numpy(series)
+    assert not isinstance(array, np.ma.MaskedArray)
+    assert not array.flags.writeable
+    assert np.shares_memory(array, series.to_numpy(allow_copy=False))
+
+
+def test_to_numpy_chunked() -> None:
+    series = pl.concat([pl.Series([1.0]), pl.Series([2.0])], rechunk=False)
+    assert series.n_chunks() == 2
+    assert to_numpy(series).tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("dtype", [pl.Float64, pl.Int64])
+def test_to_numpy_nulls(dtype: pl.DataType) -> None:
+    array = to_numpy(pl.Series([1, None, 3], dtype=dtype))
+    assert isinstance(array, np.ma.MaskedArray)
+    assert array.mask.tolist() == [False, True, False]
+    assert np.isnan(array.data[1])
+
+
+def test_to_numpy_string() -> None:
+    array = to_numpy(pl.Series(["a", None]))
+    assert array.dtype == object
+    assert array.tolist() == ["a", None]
+
+
+def test_line_nulls(ax: Axes) -> None:
+    data = pl.DataFrame({"x": [1, 2, 3, 4, 5], "y": [1.0, 2.0, None, 4.0, 5.0]})
+    Chart(data).encode(x="x", y="y").mark_line(color="k").display(ax)
+
+    (path,) = ax.collections[0].get_paths()
+    y = np.asarray(path.vertices)[:, 1]
+    assert np.isnan(y).tolist() == [0, 0, 1, 0, 0]
+
+
+def test_point_nulls(ax: Axes) -> None:
+    data = pl.DataFrame({"x": [1, None, 3], "y": [1, 2, 3]})
+    Chart(data).encode(x="x", y="y").mark_point().display(ax)
+
+    offsets: Any = ax.collections[0].get_offsets()
+    assert np.ma.is_masked(offsets)
+    assert offsets.mask[:, 0].tolist() == [False, True, False]
+
+
+@pytest.mark.parametrize(
+    ("series", "expected"),
+    [
+        (pl.Series([Decimal("1.5"), Decimal(2)]), [1.5, 2.0]),
+        (pl.Series([1, 2], dtype=pl.Int128), [1.0, 2.0]),
+        (pl.Series([1, 2], dtype=pl.UInt128), [1.0, 2.0]),
+    ],
+)
+def test_to_numpy_copy(series: pl.Series, expected: list[float]) -> None:
+    array = to_numpy(series)
+    assert array.dtype == np.float64
+    assert array.tolist() == expected
+
+
+def test_to_numpy_decimal_nulls() -> None:
+    array = to_numpy(pl.Series([Decimal(1), None]))
+    assert isinstance(array, np.ma.MaskedArray)
+    assert array.mask.tolist() == [False, True]
+
+
+@pytest.mark.parametrize("mark", ["point", "line", "bar"])
+def test_display_decimal(mark: str, ax: Axes) -> None:
+    data = pl.DataFrame({"x": [1, 2], "y": [Decimal("1.5"), Decimal("2.5")]})
+    getattr(Chart(data).encode(x="x", y="y"), f"mark_{mark}")().display(ax)
+
+    assert ax.get_ylim()[1] >= 2.5
+
+
+def test_autoscale(ax: Axes, mocker: MockerFixture) -> None:
+    spy = mocker.spy(ax, "autoscale_view")
+    ax.set_xlim(0, 1, auto=False)
+    ax.set_ylim(0, 1, auto=False)
+    autoscale(ax)
+    assert spy.call_count == 0
+
+    ax.set_autoscaley_on(True)
+    autoscale(ax)
+    assert spy.call_count == 1
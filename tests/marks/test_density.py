@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+from matplotlib.image import AxesImage
+
+from plotaris import Chart
+from plotaris.marks.density import DensityMark
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [0.0, 0.1, 0.9, 1.0, 0.0, 1.0],
+            "y": [0.0, 0.1, 0.9, 1.0, 1.0, 0.0],
+            "v": [1.0, 3.0, 5.0, 7.0, 2.0, 4.0],
+            "c": ["a", "a", "b", "b", "a", "b"],
+        },
+    )
+
+
+def image(ax: Axes) -> np.ndarray:
+    (im,) = ax.get_images()
+    assert isinstance(im, AxesImage)
+    return np.asarray(im.get_array())
+
+
+def test_collect(data: pl.DataFrame) -> None:
+    chart = Chart(data.lazy()).encode(x="x", y="y", color="c").mark_density(bins=2)
+    result = chart.collect().sort("_ix", "_iy")
+
+    assert result["_count"].to_list() == [2, 1, 1, 2]
+    assert result["c"].to_list() == ["a", "a", "b", "b"]
+    assert result.select("_nx", "_x0", "_x1").row(0) == (2, 0.0, 1.0)
+
+
+@pytest.mark.parametrize(
+    ("agg", "expected"),
+    [
+        ("count", [[2, 1], [1, 2]]),
+        ("sum", [[4, 4], [2, 12]]),
+        ("mean", [[2, 4], [2, 6]]),
+    ],
+)
+def test_agg(
+    data: pl.DataFrame,
+    ax: Axes,
+    agg: str,
+    expected: list[list[float]],
+) -> None:
+    chart = Chart(data).encode(x="x", y="y").mark_density(bins=2, agg=agg, value="v")
+    chart.display(ax)
+
+    np.testing.assert_allclose(image(ax), expected)
+    assert ax.get_xlim() == (0, 1)
+
+
+def test_color(data: pl.DataFrame, ax: Axes) -> None:
+    chart = Chart(data).encode(x="x", y="y", color="c").mark_density(bins=(2, 1))
+    chart.display(ax)
+
+    rgba = image(ax)
+    assert rgba.shape == (1, 2, 4)
+    np.testing.assert_allclose(rgba[0, :, 3], 1)
+
+
+def test_value_required() -> None:
+    with pytest.raises(ValueError, match="requires a value"):
+        DensityMark(agg="sum")
+
+
+def test_non_finite(data: pl.DataFrame, ax: Axes) -> None:
+    extra = pl.DataFrame(
+        {
+            "x": [None, float("nan"), float("inf"), 0.5],
+            "y": [0.5, 0.5, 0.5, None],
+            "v": [0.0] * 4,
+            "c": ["a"] * 4,
+        },
+    )
+    data = pl.concat([data, extra])
+    Chart(data).encode(x="x", y="y").mark_density(bins=2).display(ax)
+
+    np.testing.assert_allclose(image(ax), [[2, 1], [1, 2]])
+    assert ax.get_xlim() == (0, 1)
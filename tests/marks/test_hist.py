@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+from matplotlib.patches import Rectangle
+
+from plotaris import Chart
+from plotaris.core.data import X, Y
+from plotaris.marks.hist import HistMark
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [0.0, 0.5, 1.5, 2.0, 3.9, 4.0],
+            "c": ["a", "b", "a", "b", "a", "a"],
+        },
+    )
+
+
+def bars(ax: Axes) -> list[tuple[float, float, float, float]]:
+    return [
+        (p.get_x(), p.get_width(), p.get_y(), p.get_height())
+        for p in ax.patches
+        if isinstance(p, Rectangle)
+    ]
+
+
+def test_collect(data: pl.DataFrame) -> None:
+    result = Chart(data.lazy()).encode(x="x").mark_hist(bins=4).collect()
+    counts, edges = np.histogram(data["x"], bins=4)
+
+    assert result[X].to_list() == ((edges[:-1] + edges[1:]) / 2).tolist()
+    assert result[Y].to_list() == counts.tolist()
+
+
+def test_binwidth(data: pl.DataFrame) -> None:
+    result = Chart(data).encode(x="x").mark_hist(binwidth=3).collect()
+
+    assert result[X].to_list() == [1.5, 4.5]
+    assert result[Y].to_list() == [4, 2]
+
+
+def test_display_stack(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", color="c").mark_hist(bins=2).display(ax)
+
+    assert bars(ax) == [(0, 2, 0, 2), (0, 2, 2, 1), (2, 2, 0, 2), (2, 2, 2, 1)]
+
+
+def test_facet(data: pl.DataFrame) -> None:
+    chart = Chart(data).encode(x="x").facet(col="c").mark_hist(bins=2)
+    result = chart.collect().sort("c", X)
+
+    assert result[Y].to_list() == [2, 2, 1, 1]
+
+
+@pytest.mark.parametrize("kwargs", [{"bins": 0}, {"binwidth": 0}])
+def test_invalid(kwargs: dict[str, float]) -> None:
+    with pytest.raises(ValueError, match="positive"):
+        HistMark(**kwargs)  # pyright: ignore[reportArgumentType]
+
+
+def test_non_finite() -> None:
+    data = pl.DataFrame({"x": [0.0, None, 1.0, float("nan"), float("inf"), 2.0]})
+    result = Chart(data).encode(x="x").mark_hist(bins=2).collect()
+
+    assert result[X].to_list() == [0.5, 1.5]
+    assert result[Y].to_list() == [1, 2]
+
+
+def test_agg(data: pl.DataFrame) -> None:
+    chart = Chart(data.with_columns(w=pl.col("x") * 2)).encode(x="x", y="w")
+    result = chart.mark_hist(bins=2, agg="sum").collect()
+
+    assert result[Y].to_list() == [4.0, 19.8]
+
+
+def test_agg_requires_y(data: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match="requires a y encoding"):
+        Chart(data).encode(x="x").mark_hist(agg="mean").collect()
+
+
+def test_empty() -> None:
+    data = pl.DataFrame({"x": [None, float("nan")]})
+    result = Chart(data).encode(x="x").mark_hist().collect()
+
+    assert result.is_empty()
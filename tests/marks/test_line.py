@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+
+from plotaris import Chart
+from plotaris.colors import COLORS
+from plotaris.marks.line import PATH_SIZE, split
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [1, 2, 3, 1, 2, 3, 1, 2],
+            "y": [3, 1, 4, 1, 5, 9, 2, 6],
+            "c": ["a", "a", "a", "b", "b", "b", "a", "a"],
+            "s": [0, 0, 0, 0, 0, 0, 1, 1],
+        },
+    )
+
+
+def test_line_collection(data: pl.DataFrame, ax: Axes) -> None:
+    chart = Chart(data).encode(x="x", y="y", color=["c", "s"]).mark_line(lw=2)
+    chart.display(ax)
+
+    assert len(ax.get_lines()) == 0
+    assert len(ax.collections) == 1
+    collection = ax.collections[0]
+    assert isinstance(collection, LineCollection)
+
+    segments = collection.get_segments()
+    assert [s[:, 1].tolist() for s in segments] == [[3, 1, 4], [1, 5, 9], [2, 6]]
+    colors = np.asarray(collection.get_colors())
+    np.testing.assert_allclose(colors, [to_rgba(c) for c in COLORS[:3]])
+    np.testing.assert_array_equal(collection.get_linewidth(), [2])
+    assert ax.get_xlim()[0] < 1
+    assert ax.get_ylim()[1] > 9
+
+
+def test_fallback_kwargs(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y", color="c").mark_line(marker="o").display(ax)
+
+    assert len(ax.collections) == 0
+    assert len(ax.get_lines()) == 2
+
+
+def test_fallback_no_color(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y").mark_line().display(ax)
+
+    assert len(ax.get_lines()) == 1
+
+
+@pytest.mark.parametrize("decimate", ["minmax", "lttb"])
+def test_decimate(ax: Axes, decimate: str) -> None:
+    n = 100_000
+    rng = np.random.default_rng(0)
+    data = pl.DataFrame({"x": np.arange(n), "y": rng.standard_normal(n)})
+
+    chart = Chart(data).encode(x="x", y="y")
+    chart.mark_line(decimate=decimate, max_points=500).display(ax)
+
+    (line,) = ax.get_lines()
+    assert np.asarray(line.get_xdata()).size <= 500
+    if decimate == "minmax":
+        assert np.asarray(line.get_ydata()).min() == data["y"].min()
+
+
+def test_split() -> None:
+    segment = np.arange(10).reshape(5, 2)
+    paths = split(segment, 2)
+
+    assert [p[:, 0].tolist() for p in paths] == [[0, 2, 4], [4, 6, 8]]
+    assert all(np.shares_memory(p, segment) for p in paths)
+
+
+def test_split_long_segment(ax: Axes) -> None:
+    n = PATH_SIZE + 5
+    data = pl.DataFrame(
+        {"x": [*range(n), 0], "y": [*range(n), 0], "c": ["a"] * n + ["b"]},
+    )
+    Chart(data).encode(x="x", y="y", color="c").mark_line().display(ax)
+
+    collection = ax.collections[0]
+    assert isinstance(collection, LineCollection)
+    assert [len(s) for s in collection.get_segments()] == [PATH_SIZE + 1, 5, 1]
+    assert len(collection.get_colors()) == 3
+
+
+def test_fallback_long_lines(ax: Axes) -> None:
+    n = 2 * PATH_SIZE + 2
+    data = pl.DataFrame({"x": range(n), "y": range(n), "c": ["a", "b"] * (n // 2)})
+    Chart(data).encode(x="x", y="y", color="c").mark_line().display(ax)
+
+    assert len(ax.collections) == 0
+    assert len(ax.get_lines()) == 2
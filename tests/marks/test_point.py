@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import polars as pl
+import pytest
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_rgba
+
+from plotaris import Chart
+from plotaris.colors import COLORS
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+
+@pytest.fixture(scope="module")
+def data() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "x": [1, 2, 3, 4, 5, 6],
+            "y": [3, 1, 4, 1, 5, 9],
+            "c": ["a", "b", "a", "b", "c", "c"],
+            "s": [0, 0, 1, 1, 2, 2],
+            "m": ["p", "p", "p", "q", "q", "q"],
+        },
+    )
+
+
+def test_one_collection(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y", color="c", size="s").mark_point().display(ax)
+
+    assert len(ax.collections) == 1
+    collection = ax.collections[0]
+    assert isinstance(collection, PathCollection)
+    np.testing.assert_array_equal(np.asarray(collection.get_offsets())[:, 0], data["x"])
+    colors = [to_rgba(COLORS[i]) for i in [0, 1, 0, 1, 2, 2]]
+    np.testing.assert_allclose(np.asarray(collection.get_facecolor()), colors)
+    np.testing.assert_array_equal(collection.get_sizes(), [50, 50, 100, 100, 150, 150])
+
+
+def test_one_collection_per_shape(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y", color="c", shape="m").mark_point().display(ax)
+
+    assert len(ax.collections) == 2
+    offsets = [np.asarray(c.get_offsets())[:, 0].tolist() for c in ax.collections]
+    assert offsets == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_mark_kwargs(data: pl.DataFrame, ax: Axes) -> None:
+    Chart(data).encode(x="x", y="y").mark_point(alpha=0.5).display(ax)
+
+    assert len(ax.collections) == 1
+    assert ax.collections[0].get_alpha() == 0.5
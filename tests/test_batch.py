@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from plotaris import Chart, render_many
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from plotaris.batch import RenderResult
+
+
+def test_render_many(tmp_path: Path) -> None:
+    data = pl.DataFrame({"x": [1, 2, 3], "y": [3, 1, 2], "c": ["a", "a", "b"]})
+    charts = {
+        "line": Chart(data).encode(x="x", y="y", color="c").mark_line(),
+        "lazy": Chart(data.lazy()).encode(x="x", y="y").mark_point(),
+        "facet": Chart(data).encode(x="x", y="y").mark_bar().facet(col="c"),
+        "broken": Chart(data).encode(x="x", y="y"),
+    }
+    seen: list[RenderResult] = []
+    results = render_many(charts, tmp_path, workers=2, callback=seen.append)
+
+    assert seen == results
+    assert sorted(r.name for r in results) == sorted(charts)
+
+    for result in results:
+        if result.name == "broken":
+            assert result.error
+            assert "Mark must be defined" in result.error
+            assert not result.path.exists()
+        else:
+            assert result.ok
+            assert result.path.read_bytes().startswith(b"\x89PNG")
+
+
+def test_render() -> None:
+    data = pl.DataFrame({"x": [1, 2], "y": [3, 4]})
+    svg = Chart(data).encode(x="x", y="y").mark_line().render("svg")
+    assert b"<svg" in svg
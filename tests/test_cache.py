@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from matplotlib import rcParams
+
+from plotaris import Chart, RenderCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def data() -> pl.DataFrame:
+    return pl.DataFrame({"x": [1, 2, 3], "y": [3, 1, 2], "c": ["a", "a", "b"]})
+
+
+def chart(data: pl.DataFrame | pl.LazyFrame) -> Chart:
+    return Chart(data).encode(x="x", y=pl.col("y") * 2, color="c").mark_bar()
+
+
+def chart_key(cache: RenderCache, chart: Chart, *options: object) -> str:
+    return cache.key(chart.data, chart.encoding, chart.mark, chart.facet_spec, *options)
+
+
+def test_render_cache(tmp_path: Path, data: pl.DataFrame) -> None:
+    cache = RenderCache(tmp_path)
+    first = chart(data).render("svg", cache=cache)
+    second = chart(data).render("svg", cache=cache)
+
+    assert first == second
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_hit_skips_drawing(
+    tmp_path: Path,
+    data: pl.DataFrame,
+    mocker: MockerFixture,
+) -> None:
+    cache = RenderCache(tmp_path)
+    chart(data).render(cache=cache)
+    draw = mocker.patch("plotaris.marks.bar.BarMark.draw")
+    chart(data).render(cache=cache)
+    draw.assert_not_called()
+
+
+def test_key(tmp_path: Path, data: pl.DataFrame) -> None:
+    cache = RenderCache(tmp_path)
+    key = chart_key(cache, chart(data), "png", {})
+
+    assert chart_key(cache, chart(data.clone()), "png", {}) == key
+    lazy = chart_key(cache, chart(data.lazy()), "png", {})
+    assert chart_key(cache, chart(data.lazy()), "png", {}) == lazy
+    assert chart_key(cache, chart(data), "svg", {}) != key
+    assert chart_key(cache, chart(data), "png", {"dpi": 50}) != key
+    assert chart_key(cache, chart(data.reverse()), "png", {}) != key
+    assert chart_key(cache, chart(data).encode(y=pl.col("y") * 3), "png", {}) != key
+    assert chart_key(cache, chart(data).mark_bar(position="stack"), "png", {}) != key
+    assert chart_key(cache, chart(data).facet(col="c"), "png", {}) != key
+
+
+def test_key_rcparams(
+    tmp_path: Path,
+    data: pl.DataFrame,
+    mocker: MockerFixture,
+) -> None:
+    cache = RenderCache(tmp_path)
+    key = chart_key(cache, chart(data), "png", {})
+    mocker.patch.dict(rcParams, {"figure.dpi": 33})
+    assert chart_key(cache, chart(data), "png", {}) != key
+
+
+def test_evict(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path, max_bytes=250)
+    keys = [f"{i:064x}" for i in range(3)]
+    for key in keys:
+        cache.put(key, b"x" * 100)
+        cache.get(keys[0])
+
+    assert cache.stats.evictions == 1
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_key_projection(tmp_path: Path, data: pl.DataFrame) -> None:
+    cache = RenderCache(tmp_path)
+    chart(data.with_columns(unused=0)).render(cache=cache)
+    chart(data.with_columns(unused=1).lazy()).render(cache=cache)
+    chart(data.with_columns(pl.col("y") + 1)).render(cache=cache)
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 2
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_US = 50_000
+"""The cumulative import time of `plotaris` in microseconds."""
+RENDER = """
+import polars as pl
+from plotaris import Chart
+chart = Chart(pl.DataFrame({"x": [1]})).encode(x="x", y="x")
+chart.facet(col="x").mark_point().render()
+"""
+"""Rendering a faceted chart, which must not import pyplot."""
+
+
+def run(code: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+
+def cumulative(stderr: str, module: str) -> int:
+    """Return the cumulative time of a module from `-X importtime` output."""
+    for line in stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    pytest.fail(f"{module} not imported")
+
+
+def test_import_time() -> None:
+    result = run("import plotaris")
+    assert cumulative(result.stderr, "plotaris") < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize(
+    ("code", "loaded"),
+    [
+        ("import plotaris", []),
+        ("from plotaris import Chart", ["polars"]),
+        ("from plotaris import init", []),
+        (RENDER, ["polars", "matplotlib"]),
+    ],
+)
+def test_import_modules(code: str, loaded: list[str]) -> None:
+    heavy = ["polars", "matplotlib", "matplotlib.pyplot"]
+    check = f"import sys\n{code}\nprint(*[m for m in {heavy} if m in sys.modules])"
+    result = run(check)
+    assert result.stdout.split() == loaded